@@ -32,6 +32,7 @@ Bundle Support: DISABLED (bundles_disabled=True)
 
 import os
 import random
+import threading
 import datetime
 import json
 import re
@@ -125,6 +126,11 @@ from ai_filter_cache_helpers import (
     set_cached_web_price,
     get_cached_variant_info,
     set_cached_variant_info,
+    component_cache_key,
+    get_cached_component_response,
+    set_cached_component_response,
+    clear_component_cache,
+    COMPONENT_CACHE_FILE,
     load_caches as load_cache_helpers
 )
 
@@ -251,10 +257,10 @@ CLUSTER_CACHE_DAYS = 7
 CATEGORY_THRESHOLD_CACHE_DAYS = 365  # Category behavior is stable year-over-year
 
 RUN_COST_USD: float = 0.0
+_COST_LOCK = threading.Lock()  # add_cost() may be called from Phase 4 eval workers
 DAY_COST_FILE = "ai_cost_day.txt"
 
 VARIANT_CACHE_FILE = "variant_cache.json"
-COMPONENT_CACHE_FILE = "component_cache.json"
 CLUSTER_CACHE_FILE = "variant_cluster_cache.json"
 CATEGORY_THRESHOLD_CACHE_FILE = "category_threshold_cache.json"
 
@@ -494,6 +500,34 @@ def call_ai(
     return None
 
 
+def call_ai_component_cached(
+    prompt: str,
+    max_tokens: int = 500,
+    image_url: str = None,
+) -> Optional[str]:
+    """
+    call_ai() for bundle component extraction.
+    
+    Near-duplicate listings (same title/description up to case and
+    whitespace) produce the same extraction prompt, so text responses are
+    served from component_cache.json for COMPONENT_CACHE_DAYS.
+    Vision calls are never cached.
+    """
+    if image_url or not CACHE_ENABLED:
+        return call_ai(prompt, max_tokens=max_tokens, image_url=image_url)
+    
+    key = component_cache_key(prompt)
+    cached = get_cached_component_response(key, COMPONENT_CACHE_DAYS)
+    if cached is not None:
+        print("      💾 Component cache hit")
+        return cached
+    
+    raw = call_ai(prompt, max_tokens=max_tokens)
+    if raw:
+        set_cached_component_response(key, raw)
+    return raw
+
+
 # ==============================================================================
 # v11: EXPLICIT QUANTITY PARSING FROM SHOP SNIPPETS
 # ==============================================================================
@@ -1234,6 +1268,8 @@ def fetch_variant_info_batch(
     Args:
         live_bid_count: Count of listings with bids_count > 0 (market signal for websearch validation)
     """
+    # Drop empty and repeated keys (first-seen order) so no variant is priced or searched twice
+    variant_keys = list(dict.fromkeys(filter(None, variant_keys or ())))
     if not variant_keys:
         return {}
     
@@ -1243,10 +1279,13 @@ def fetch_variant_info_batch(
     
     results = {}
     
-    # Phase 1: Check market prices first
+    # Phase 1: Check market prices first (one lookup per key; hit count feeds websearch gating)
+    market_prices_count = 0
     for vk in variant_keys:
-        if vk in market_prices:
-            results[vk] = market_prices[vk].copy()
+        market = market_prices.get(vk)
+        if market is not None:
+            results[vk] = market.copy()
+            market_prices_count += 1
     
     # Phase 2: Web search for variants still missing prices
     need_new_price = [vk for vk in variant_keys if vk not in results or results[vk].get("new_price") is None]
@@ -1270,8 +1309,7 @@ def fetch_variant_info_batch(
         if websearch_variants:
             print(f"\n   BATCH web searching {len(websearch_variants)} variants (rate-limit safe)...")
 
-            # TASK 2: Pass market signal metrics for gating
-            market_prices_count = len([v for v in variant_keys if v in market_prices])
+            # TASK 2: Pass market signal metrics for gating (market_prices_count from Phase 1)
             # FIXED: Use live_bid_count from main.py (actual listings with bids_count > 0)
             # This promotes live bids to valid market signals for websearch validation
             listings_with_bids = live_bid_count
@@ -1355,11 +1393,14 @@ def calculate_market_resale_from_listings(
     # Filter listings by identity_key
     matching = [l for l in listings if l.get("_identity_key") == identity_key]
     
-    print(f"         🔍 Filtering {len(listings)} listings for identity_key='{identity_key}'")
-    print(f"         Matching listings: {len(matching)}")
+    # Diagnostics (one line per listing) are collected and printed in one write
+    log_lines = []
+    log_lines.append(f"         🔍 Filtering {len(listings)} listings for identity_key='{identity_key}'")
+    log_lines.append(f"         Matching listings: {len(matching)}")
     
     if not matching:
-        print(f"         ❌ No matching listings found")
+        log_lines.append(f"         ❌ No matching listings found")
+        print("\n".join(log_lines))
         return None
     
     # Collect bid samples with smart filtering
@@ -1375,31 +1416,34 @@ def calculate_market_resale_from_listings(
         
         if not bid:
             rejected_count += 1
-            print(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason=no_bid")
+            log_lines.append(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason=no_bid")
             continue
         
         # Accept if: Active auction (bids_count > 0) with reasonable price
         if bids_count > 0 and bid >= ACTIVE_AUCTION_MIN_PRICE:
             samples.append(bid)
-            print(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (active auction)")
+            log_lines.append(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (active auction)")
         # Accept if: Starting bid (bids_count = 0) but high enough to be realistic
         elif bids_count == 0 and bid >= unrealistic_floor:
             samples.append(bid)
-            print(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (high starting bid)")
+            log_lines.append(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (high starting bid)")
         else:
             rejected_count += 1
             if bids_count > 0:
                 reason = f"below_active_floor (bid={bid} < {ACTIVE_AUCTION_MIN_PRICE})"
             else:
                 reason = f"below_starting_floor (bid={bid} < {unrealistic_floor})"
-            print(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason={reason}")
+            log_lines.append(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason={reason}")
     
-    print(f"         Valid samples: {len(samples)}, Rejected: {rejected_count}")
+    log_lines.append(f"         Valid samples: {len(samples)}, Rejected: {rejected_count}")
     
     if len(samples) < 2:
-        print(f"         ❌ Insufficient samples ({len(samples)} < 2 required)")
+        log_lines.append(f"         ❌ Insufficient samples ({len(samples)} < 2 required)")
+        print("\n".join(log_lines))
         return None
     
+    print("\n".join(log_lines))
+    
     # Calculate median
     median_price = statistics.median(samples)
     
@@ -1430,7 +1474,13 @@ def calculate_all_market_resale_prices(
     Example: iPhone 12 mini 128GB + iPhone 12 mini 256GB → same market price pool
     """
     # PHASE 4.2: Group by canonical_identity_key instead of variant_key
-    identity_keys = set(l.get("_identity_key") for l in listings if l.get("_identity_key"))
+    # One pass over listings; each key below reads its bucket instead of rescanning all listings
+    listings_by_identity: Dict[str, List[Dict[str, Any]]] = {}
+    for l in listings:
+        identity_key = l.get("_identity_key")
+        if identity_key:
+            listings_by_identity.setdefault(identity_key, []).append(l)
+    identity_keys = listings_by_identity.keys()
     variant_new_prices = variant_new_prices or {}
     reference_price = _get_new_price_estimate(query_analysis)
     
@@ -1449,7 +1499,7 @@ def calculate_all_market_resale_prices(
         print(f"\n   🔑 Processing identity_key: '{identity_key}'")
         
         # Use first variant_key for new price lookup (backwards compatibility)
-        matching_listings = [l for l in listings if l.get("_identity_key") == identity_key]
+        matching_listings = listings_by_identity[identity_key]
         print(f"      Current run listings: {len(matching_listings)}")
         
         first_variant_key = matching_listings[0].get("variant_key") if matching_listings else None
@@ -1626,26 +1676,35 @@ BUNDLE_KEYWORDS = [
     "inkl", "inklusive", "mit", "plus", "und", "&",
 ]
 
+# Precompiled for looks_like_bundle(); "stück"/"stk" need the extra
+# quantity-notation check, every other keyword is a plain substring hit.
+_BUNDLE_COUNT_KEYWORDS = [kw for kw in BUNDLE_KEYWORDS if kw in ("stück", "stk")]
+_BUNDLE_KEYWORD_RE = re.compile(
+    "|".join(re.escape(kw) for kw in BUNDLE_KEYWORDS if kw not in _BUNDLE_COUNT_KEYWORDS)
+)
+_STK_QUANTITY_RE = re.compile(r'\d+\s*stk\.?\s*[àax@]\s*\d+')
+_COUNT_WITH_ITEM_RE = re.compile(r'\d+\s*(stück|stk)\s+\w+')
+_QTY_PATTERN_RE = re.compile(r'\b(\d+)\s*(x|pcs|pieces?)\b')  # Removed stück/stk - handled above
+
 def looks_like_bundle(title: str, description: str = "") -> bool:
     """Quick check if listing might be a bundle."""
     text = f"{title} {description}".lower()
     
     # v9.0 FIX: "2 Stk. à 2.5kg" = Quantity, NOT bundle!
     # Pattern: Zahl + Stk + à/x/@ + Gewicht = single product with quantity
-    if re.search(r'\d+\s*stk\.?\s*[àax@]\s*\d+', text):
+    if _STK_QUANTITY_RE.search(text):
         return False
     
-    # Check for real bundle keywords
-    for kw in BUNDLE_KEYWORDS:
-        if kw in text:
-            # But exclude "stück/stk" if it's just quantity notation
-            if kw in ["stück", "stk"] and not re.search(r'\d+\s*(stück|stk)\s+\w+', text):
-                continue  # Skip - it's just "2 Stk." quantity
-            return True
+    # Check for real bundle keywords (one scan for all of them)
+    if _BUNDLE_KEYWORD_RE.search(text):
+        return True
+    
+    # "stück/stk" only counts if it's more than quantity notation ("2 Stk.")
+    if any(kw in text for kw in _BUNDLE_COUNT_KEYWORDS) and _COUNT_WITH_ITEM_RE.search(text):
+        return True
     
     # Quantity pattern - but only for real bundles with multiple items
-    qty_pattern = r'\b(\d+)\s*(x|pcs|pieces?)\b'  # Removed stück/stk - handled above
-    if re.search(qty_pattern, text):
+    if _QTY_PATTERN_RE.search(text):
         return True
     
     return False
@@ -2040,7 +2099,7 @@ def price_bundle_components_v2(
             print(f"      {comp.display_name}: {comp.resale_price:.2f} CHF (market, n={market_price.get('sample_size', 0)})")
         
         # === PRIORITY 2: Weight-based pricing for fitness ===
-        elif is_fitness and comp.product_type in ["hantelscheibe", "kurzhantel", "kettlebell"]:
+        elif is_fitness and comp.product_type in {"hantelscheibe", "kurzhantel", "kettlebell"}:
             weight_kg = comp.specs.get("weight_kg")
             if weight_kg and weight_kg > 0:
                 material = comp.specs.get("material", "standard")
@@ -2221,6 +2280,9 @@ def calculate_soft_market_price(
     if not search_identity or not all_listings_for_variant:
         return None
     
+    # Diagnostics (one line per listing) are collected and printed in one write
+    log_lines = []
+    
     # DEDUPLICATION: Remove duplicate listings by source_id (same listing from DB + current run)
     seen_source_ids = set()
     unique_listings = []
@@ -2233,20 +2295,20 @@ def calculate_soft_market_price(
         unique_listings.append(listing)
     
     if len(unique_listings) < len(all_listings_for_variant):
-        print(f"   SOFT MARKET: Deduplicated {len(all_listings_for_variant)} → {len(unique_listings)} unique listings")
+        log_lines.append(f"   SOFT MARKET: Deduplicated {len(all_listings_for_variant)} → {len(unique_listings)} unique listings")
     
     # Filter valid samples with bids
     valid_samples = []
-    print(f"   SOFT MARKET DEBUG: Processing {len(unique_listings)} listings for identity='{search_identity}'")
+    log_lines.append(f"   SOFT MARKET DEBUG: Processing {len(unique_listings)} listings for identity='{search_identity}'")
     for idx, listing in enumerate(unique_listings):
         bid = listing.get("current_bid") or listing.get("current_price_ricardo")
         bids_count = listing.get("bids_count", 0)
         hours_remaining = listing.get("hours_remaining", 999)
         
-        print(f"      [{idx}] bid={bid}, bids_count={bids_count}, hours_remaining={hours_remaining}")
+        log_lines.append(f"      [{idx}] bid={bid}, bids_count={bids_count}, hours_remaining={hours_remaining}")
         
         if not bid or bid <= 0 or bids_count == 0:
-            print(f"      [{idx}] REJECTED: bid={bid}, bids_count={bids_count}")
+            log_lines.append(f"      [{idx}] REJECTED: bid={bid}, bids_count={bids_count}")
             continue
         
         # Time adjustment factor
@@ -2261,9 +2323,10 @@ def calculate_soft_market_price(
         
         adjusted_bid = bid * time_factor
         valid_samples.append(adjusted_bid)
-        print(f"      [{idx}] ACCEPTED: adjusted_bid={adjusted_bid:.2f}")
+        log_lines.append(f"      [{idx}] ACCEPTED: adjusted_bid={adjusted_bid:.2f}")
     
-    print(f"   SOFT MARKET DEBUG: valid_samples count={len(valid_samples)}")
+    log_lines.append(f"   SOFT MARKET DEBUG: valid_samples count={len(valid_samples)}")
+    print("\n".join(log_lines))
     
     # Require at least 2 samples
     if len(valid_samples) < 2:
@@ -2783,7 +2846,7 @@ def evaluate_listing_with_ai(
                 category=category,
                 image_url=image_url,
                 use_vision=False,  # First pass: no vision
-                call_ai_func=call_ai,
+                call_ai_func=call_ai_component_cached,
                 v10_products=v10_products,  # Reuse v10 extraction if available
             )
             
@@ -2796,7 +2859,7 @@ def evaluate_listing_with_ai(
                     category=category,
                     image_url=image_url,
                     use_vision=True,
-                    call_ai_func=call_ai,
+                    call_ai_func=call_ai_component_cached,
                 )
                 if vision_extraction.confidence > bundle_extraction.confidence:
                     bundle_extraction = vision_extraction
@@ -3163,7 +3226,8 @@ def reset_run_cost():
 def add_cost(amount: float):
     """Add cost to run total."""
     global RUN_COST_USD
-    RUN_COST_USD += amount
+    with _COST_LOCK:
+        RUN_COST_USD += amount
 
 
 def get_run_cost_summary() -> Dict[str, Any]:
@@ -3264,7 +3328,7 @@ def apply_config(config):
     global RICARDO_FEE_PERCENT, SHIPPING_COST_CHF, MIN_PROFIT_THRESHOLD
     global BUNDLE_ENABLED, BUNDLE_DISCOUNT_PERCENT, BUNDLE_MIN_COMPONENT_VALUE
     global BUNDLE_USE_VISION, BUNDLE_ALWAYS_SCRAPE_DETAIL
-    global CACHE_ENABLED, USE_VISION, VISION_RATE, DEFAULT_CAR_MODEL
+    global CACHE_ENABLED, COMPONENT_CACHE_DAYS, USE_VISION, VISION_RATE, DEFAULT_CAR_MODEL
     global WEB_SEARCH_ENABLED  # v7.3.2: Toggle expensive web search
     
     # Handle both dict and object config
@@ -3312,6 +3376,9 @@ def apply_config(config):
     val = get_nested("cache", "enabled", None)
     if val is not None:
         CACHE_ENABLED = val
+    val = get_nested("cache", "component_cache_days", None)
+    if val is not None:
+        COMPONENT_CACHE_DAYS = val
     val = get_nested("ai", "use_vision", None)
     if val is not None:
         USE_VISION = val
@@ -3358,10 +3425,10 @@ def apply_ai_budget_from_cfg(config):
 
 def clear_all_caches():
     """Clear all cache files."""
-    global _variant_cache, _component_cache, _cluster_cache, _web_price_cache, _category_threshold_cache
+    global _variant_cache, _cluster_cache, _web_price_cache, _category_threshold_cache
     
     _variant_cache = {}
-    _component_cache = {}
+    clear_component_cache()
     _cluster_cache = {}
     _web_price_cache = {}
     _category_threshold_cache = {}
@@ -4,8 +4,10 @@ Separated to avoid circular imports and maintain clean architecture.
 """
 from typing import Dict, Optional
 from datetime import datetime, timedelta
+import hashlib
 import json
 import os
+import threading
 
 
 # Cache dictionaries (imported from ai_filter.py)
@@ -17,6 +19,11 @@ WEB_PRICE_CACHE_DAYS = 60
 VARIANT_CACHE_FILE = "variant_cache.json"
 VARIANT_CACHE_DAYS = 30
 
+# Bundle component extraction responses, keyed by normalized prompt
+_component_cache: Optional[Dict[str, Dict]] = None  # lazily loaded from disk
+_component_cache_lock = threading.Lock()
+COMPONENT_CACHE_FILE = "component_cache.json"
+
 
 def get_cached_web_price(variant_key: str) -> Optional[Dict]:
     """
@@ -148,3 +155,77 @@ def load_caches():
                 _variant_cache = json.load(f)
         except:
             _variant_cache = {}
+
+
+def component_cache_key(prompt: str) -> str:
+    """
+    Cache key for a component extraction prompt.
+    Case and whitespace differences in the listing text map to the same key.
+    """
+    normalized = " ".join((prompt or "").lower().split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def _get_component_cache() -> Dict[str, Dict]:
+    global _component_cache
+    if _component_cache is None:
+        _component_cache = {}
+        if os.path.exists(COMPONENT_CACHE_FILE):
+            try:
+                with open(COMPONENT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    _component_cache = json.load(f)
+            except:
+                _component_cache = {}
+    return _component_cache
+
+
+def get_cached_component_response(key: str, max_age_days: int) -> Optional[str]:
+    """
+    Get a cached raw AI response for a component extraction prompt.
+    
+    Returns:
+        Raw response text if cached and not expired
+        None if not cached or expired
+    """
+    with _component_cache_lock:
+        cached = _get_component_cache().get(key)
+    if not cached:
+        return None
+    
+    try:
+        cached_dt = datetime.fromisoformat(cached.get("cached_at", ""))
+        if (datetime.now() - cached_dt).days > max_age_days:
+            return None
+    except:
+        return None
+    
+    return cached.get("response")
+
+
+def set_cached_component_response(key: str, response: str):
+    """
+    Cache a raw AI response for a component extraction prompt.
+    """
+    if not key or not response:
+        return
+    
+    with _component_cache_lock:
+        cache = _get_component_cache()
+        cache[key] = {
+            "response": response,
+            "cached_at": datetime.now().isoformat(),
+        }
+        
+        # Persist to file
+        try:
+            with open(COMPONENT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2, ensure_ascii=False)
+        except:
+            pass
+
+
+def clear_component_cache():
+    """Drop the in-memory component cache (file is removed by the caller)."""
+    global _component_cache
+    with _component_cache_lock:
+        _component_cache = {}
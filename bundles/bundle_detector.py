@@ -17,6 +17,16 @@ BUNDLE_KEYWORDS = [
     "inkl", "inklusive", "mit", "plus", "und", "&",
 ]
 
+# Precompiled for looks_like_bundle(); "stück"/"stk" need the extra
+# quantity-notation check, every other keyword is a plain substring hit.
+_BUNDLE_COUNT_KEYWORDS = [kw for kw in BUNDLE_KEYWORDS if kw in ("stück", "stk")]
+_BUNDLE_KEYWORD_RE = re.compile(
+    "|".join(re.escape(kw) for kw in BUNDLE_KEYWORDS if kw not in _BUNDLE_COUNT_KEYWORDS)
+)
+_STK_QUANTITY_RE = re.compile(r'\d+\s*stk\.?\s*[àax@]\s*\d+')
+_COUNT_WITH_ITEM_RE = re.compile(r'\d+\s*(stück|stk)\s+\w+')
+_QTY_PATTERN_RE = re.compile(r'\b(\d+)\s*(x|pcs|pieces?)\b')
+
 WEIGHT_PLATE_KEYWORDS = [
     "hantelscheibe", "gewichtsscheibe", "plate", "scheibe",
     "bumper", "gusseisen", "olympia", "weight",
@@ -79,20 +89,19 @@ def looks_like_bundle(title: str, description: str = "") -> bool:
     
     # v9.0 FIX: "2 Stk. à 2.5kg" = Quantity, NOT bundle!
     # Pattern: Zahl + Stk + à/x/@ + Gewicht = single product with quantity
-    if re.search(r'\d+\s*stk\.?\s*[àax@]\s*\d+', text):
+    if _STK_QUANTITY_RE.search(text):
         return False
     
-    # Check for real bundle keywords
-    for kw in BUNDLE_KEYWORDS:
-        if kw in text:
-            # But exclude "stück/stk" if it's just quantity notation
-            if kw in ["stück", "stk"] and not re.search(r'\d+\s*(stück|stk)\s+\w+', text):
-                continue  # Skip - it's just "2 Stk." quantity
-            return True
+    # Check for real bundle keywords (one scan for all of them)
+    if _BUNDLE_KEYWORD_RE.search(text):
+        return True
+    
+    # "stück/stk" only counts if it's more than quantity notation ("2 Stk.")
+    if any(kw in text for kw in _BUNDLE_COUNT_KEYWORDS) and _COUNT_WITH_ITEM_RE.search(text):
+        return True
     
     # Quantity pattern - but only for real bundles with multiple items
-    qty_pattern = r'\b(\d+)\s*(x|pcs|pieces?)\b'
-    if re.search(qty_pattern, text):
+    if _QTY_PATTERN_RE.search(text):
         return True
     
     return False
@@ -82,6 +82,8 @@ class GeneralConf:
     # v7.0: Detail page scraping settings
     detail_pages_enabled: bool = False
     max_detail_pages_per_run: int = 5
+    # Write the listings export gzip-compressed (last_run_listings.json.gz)
+    compress_exports: bool = False
 
 
 @dataclass
@@ -110,6 +112,8 @@ class AIConf:
     use_ai_vision: bool = True
     temperature: float = 0.2
     adaptive_vision_rate: float = 0.10
+    # Parallel listing evaluations in Phase 4 (1 = sequential)
+    eval_workers: int = 1
     
     # Web search settings
     web_search: WebSearchConf = field(default_factory=WebSearchConf)
@@ -187,6 +191,7 @@ def load_config() -> Cfg:
             # v7.0: Detail page settings
             detail_pages_enabled=general.get("detail_pages_enabled", False),
             max_detail_pages_per_run=int(general.get("max_detail_pages_per_run", 5)),
+            compress_exports=bool(general.get("compress_exports", False)),
         ),
         pg=PGConf(
             host=pg.get("host", "localhost"),
@@ -231,6 +236,7 @@ def load_config() -> Cfg:
             use_ai_vision=ai.get("use_ai_vision", False),
             temperature=float(ai.get("temperature", 0.3)),
             adaptive_vision_rate=ai.get("adaptive_vision_rate", 0.10),
+            eval_workers=int(ai.get("eval_workers", 1)),
             web_search=WebSearchConf(
                 enabled=web_search.get("enabled", True),
                 preferred_shops=web_search.get("preferred_shops", ["digitec.ch", "galaxus.ch"]),
@@ -18,6 +18,7 @@ PostgreSQL database operations with UUID run_id, TIMESTAMPTZ, NUMERIC(12,2).
 
 import psycopg2
 from psycopg2 import sql
+from psycopg2.extras import execute_values
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Tuple
 import json
@@ -383,6 +384,39 @@ def update_product_prices(
 # LISTING MANAGEMENT
 # ==============================================================================
 
+# Upsert statements shared by the per-row writers below and save_evaluations_bulk().
+# {values} is filled once at import: the one-row template for cur.execute() (*_ROW_SQL)
+# or execute_values()' "%s" placeholder (*_PAGE_SQL).
+_LISTING_UPSERT_SQL = """
+    INSERT INTO listings (
+        run_id, platform, source_id, url, title, product_id, image_url,
+        buy_now_price, current_bid, bids_count, end_time,
+        location, shipping_cost, pickup_available, seller_rating,
+        identity_key, variant_key,
+        first_seen, last_seen
+    ) VALUES {values}
+    ON CONFLICT (platform, source_id) DO UPDATE SET
+        url = EXCLUDED.url,
+        title = EXCLUDED.title,
+        product_id = COALESCE(EXCLUDED.product_id, listings.product_id),
+        image_url = COALESCE(EXCLUDED.image_url, listings.image_url),
+        buy_now_price = EXCLUDED.buy_now_price,
+        current_bid = EXCLUDED.current_bid,
+        bids_count = EXCLUDED.bids_count,
+        end_time = EXCLUDED.end_time,
+        location = COALESCE(EXCLUDED.location, listings.location),
+        shipping_cost = COALESCE(EXCLUDED.shipping_cost, listings.shipping_cost),
+        pickup_available = COALESCE(EXCLUDED.pickup_available, listings.pickup_available),
+        seller_rating = COALESCE(EXCLUDED.seller_rating, listings.seller_rating),
+        identity_key = COALESCE(EXCLUDED.identity_key, listings.identity_key),
+        variant_key = COALESCE(EXCLUDED.variant_key, listings.variant_key),
+        last_seen = NOW()
+"""
+_LISTING_UPSERT_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())"
+_LISTING_UPSERT_ROW_SQL = _LISTING_UPSERT_SQL.format(values=_LISTING_UPSERT_TEMPLATE)
+_LISTING_UPSERT_PAGE_SQL = _LISTING_UPSERT_SQL.format(values="%s")
+
+
 def upsert_listing(
     conn,
     run_id: str,
@@ -408,38 +442,7 @@ def upsert_listing(
     run_id = assert_valid_uuid(run_id, context="upsert_listing()")
     
     with conn.cursor() as cur:
-        cur.execute("""
-            INSERT INTO listings (
-                run_id, platform, source_id, url, title, product_id, image_url,
-                buy_now_price, current_bid, bids_count, end_time,
-                location, shipping_cost, pickup_available, seller_rating,
-                identity_key, variant_key,
-                first_seen, last_seen
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s,
-                NOW(), NOW()
-            )
-            ON CONFLICT (platform, source_id) DO UPDATE SET
-                url = EXCLUDED.url,
-                title = EXCLUDED.title,
-                product_id = COALESCE(EXCLUDED.product_id, listings.product_id),
-                image_url = COALESCE(EXCLUDED.image_url, listings.image_url),
-                buy_now_price = EXCLUDED.buy_now_price,
-                current_bid = EXCLUDED.current_bid,
-                bids_count = EXCLUDED.bids_count,
-                end_time = EXCLUDED.end_time,
-                location = COALESCE(EXCLUDED.location, listings.location),
-                shipping_cost = COALESCE(EXCLUDED.shipping_cost, listings.shipping_cost),
-                pickup_available = COALESCE(EXCLUDED.pickup_available, listings.pickup_available),
-                seller_rating = COALESCE(EXCLUDED.seller_rating, listings.seller_rating),
-                identity_key = COALESCE(EXCLUDED.identity_key, listings.identity_key),
-                variant_key = COALESCE(EXCLUDED.variant_key, listings.variant_key),
-                last_seen = NOW()
-            RETURNING id
-        """, (
+        cur.execute(_LISTING_UPSERT_ROW_SQL + "RETURNING id", (
             run_id, platform, source_id, url, title, product_id, image_url,
             buy_now_price, current_bid, bids_count, end_time,
             location, shipping_cost, pickup_available, seller_rating,
@@ -599,6 +602,27 @@ def get_listings_by_search_identity(conn, run_id: str, search_identity: str) ->
 # DEAL MANAGEMENT (Single Products)
 # ==============================================================================
 
+_DEAL_UPSERT_SQL = """
+    INSERT INTO deals (
+        listing_id, product_id, run_id,
+        cost_estimate, market_value, expected_profit,
+        deal_score, strategy, strategy_reason, evaluated_at
+    ) VALUES {values}
+    ON CONFLICT (listing_id, run_id) DO UPDATE SET
+        product_id = EXCLUDED.product_id,
+        cost_estimate = EXCLUDED.cost_estimate,
+        market_value = EXCLUDED.market_value,
+        expected_profit = EXCLUDED.expected_profit,
+        deal_score = EXCLUDED.deal_score,
+        strategy = EXCLUDED.strategy,
+        strategy_reason = EXCLUDED.strategy_reason,
+        evaluated_at = NOW()
+"""
+_DEAL_UPSERT_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())"
+_DEAL_UPSERT_ROW_SQL = _DEAL_UPSERT_SQL.format(values=_DEAL_UPSERT_TEMPLATE)
+_DEAL_UPSERT_PAGE_SQL = _DEAL_UPSERT_SQL.format(values="%s")
+
+
 def insert_deal(
     conn,
     listing_id: int,
@@ -624,25 +648,7 @@ def insert_deal(
     deal_score = max(1.0, min(10.0, float(deal_score)))
     
     with conn.cursor() as cur:
-        cur.execute("""
-            INSERT INTO deals (
-                listing_id, product_id, run_id,
-                cost_estimate, market_value, expected_profit,
-                deal_score, strategy, strategy_reason, evaluated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW()
-            )
-            ON CONFLICT (listing_id, run_id) DO UPDATE SET
-                product_id = EXCLUDED.product_id,
-                cost_estimate = EXCLUDED.cost_estimate,
-                market_value = EXCLUDED.market_value,
-                expected_profit = EXCLUDED.expected_profit,
-                deal_score = EXCLUDED.deal_score,
-                strategy = EXCLUDED.strategy,
-                strategy_reason = EXCLUDED.strategy_reason,
-                evaluated_at = NOW()
-            RETURNING id
-        """, (
+        cur.execute(_DEAL_UPSERT_ROW_SQL + "RETURNING id", (
             listing_id, product_id, run_id,
             cost_estimate, market_value, expected_profit,
             deal_score, strategy, strategy_reason
@@ -652,6 +658,27 @@ def insert_deal(
     return deal_id
 
 
+DEAL_AUDIT_PRICE_SOURCES = {
+    'web_median', 'web_single', 'web_median_qty_adjusted',
+    'ai_estimate', 'query_baseline', 'buy_now_fallback',
+    'bundle_aggregate', 'market_auction', 'no_price'
+}
+
+_DEAL_AUDIT_UPSERT_SQL = """
+    INSERT INTO deal_audit (deal_id, price_source, ai_cost_usd, cache_hit, web_search_used, vision_used)
+    VALUES {values}
+    ON CONFLICT (deal_id) DO UPDATE SET
+        price_source = EXCLUDED.price_source,
+        ai_cost_usd = EXCLUDED.ai_cost_usd,
+        cache_hit = EXCLUDED.cache_hit,
+        web_search_used = EXCLUDED.web_search_used,
+        vision_used = EXCLUDED.vision_used,
+        created_at = NOW()
+"""
+_DEAL_AUDIT_UPSERT_ROW_SQL = _DEAL_AUDIT_UPSERT_SQL.format(values="(%s, %s, %s, %s, %s, %s)")
+_DEAL_AUDIT_UPSERT_PAGE_SQL = _DEAL_AUDIT_UPSERT_SQL.format(values="%s")
+
+
 def insert_deal_audit(
     conn,
     deal_id: int,
@@ -662,26 +689,13 @@ def insert_deal_audit(
     vision_used: bool = False
 ):
     """Inserts pipeline metadata for a deal."""
-    valid_sources = {
-        'web_median', 'web_single', 'web_median_qty_adjusted',
-        'ai_estimate', 'query_baseline', 'buy_now_fallback',
-        'bundle_aggregate', 'market_auction', 'no_price'
-    }
-    if price_source not in valid_sources:
+    if price_source not in DEAL_AUDIT_PRICE_SOURCES:
         price_source = 'no_price'
     
     with conn.cursor() as cur:
-        cur.execute("""
-            INSERT INTO deal_audit (deal_id, price_source, ai_cost_usd, cache_hit, web_search_used, vision_used)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON CONFLICT (deal_id) DO UPDATE SET
-                price_source = EXCLUDED.price_source,
-                ai_cost_usd = EXCLUDED.ai_cost_usd,
-                cache_hit = EXCLUDED.cache_hit,
-                web_search_used = EXCLUDED.web_search_used,
-                vision_used = EXCLUDED.vision_used,
-                created_at = NOW()
-        """, (deal_id, price_source, ai_cost_usd, cache_hit, web_search_used, vision_used))
+        cur.execute(_DEAL_AUDIT_UPSERT_ROW_SQL, (
+            deal_id, price_source, ai_cost_usd, cache_hit, web_search_used, vision_used
+        ))
 
 
 # ==============================================================================
@@ -765,12 +779,7 @@ def insert_bundle_audit(
     web_search_used: bool = False
 ):
     """Inserts pipeline metadata for a bundle."""
-    valid_sources = {
-        'web_median', 'web_single', 'web_median_qty_adjusted',
-        'ai_estimate', 'query_baseline', 'buy_now_fallback',
-        'bundle_aggregate', 'market_auction', 'no_price'
-    }
-    if price_source not in valid_sources:
+    if price_source not in DEAL_AUDIT_PRICE_SOURCES:
         price_source = 'bundle_aggregate'
     
     with conn.cursor() as cur:
@@ -1385,25 +1394,17 @@ def export_run_stats(conn, filepath: str = "last_run_stats.json"):
 # BRIDGE FUNCTION: Old format → New schema
 # ==============================================================================
 
-def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
+def _prepare_evaluation(
+    conn,
+    data: Dict[str, Any],
+    product_ids: Optional[Dict[Tuple[str, str], Optional[int]]] = None
+) -> Dict[str, Any]:
     """
-    Bridge function: Takes old upsert_listing data format and inserts into new v2.2 schema.
-    
-    This handles the full flow:
-    1. Get/create product (from variant_key)
-    2. Upsert listing
-    3. Insert deal OR bundle
-    4. Insert audit record
-    
-    Args:
-        conn: Database connection
-        data: Old format dict with all fields from main.py
-        
-    Returns:
-        Dict with created IDs: {listing_id, product_id, deal_id/bundle_id}
+    Shared first half of save_evaluation() / save_evaluations_bulk():
+    validates the row, resolves (or creates) its product and derives the
+    deal values. product_ids memoizes (variant_key, identity_key) → product_id
+    across the rows of one bulk save.
     """
-    import json
-    
     # Extract run_id (required)
     run_id = data.get("run_id")
     if not run_id:
@@ -1435,7 +1436,10 @@ def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
         variant_key = identity_key
         print(f"   🔧 DB PERSIST FIX: Using identity_key as variant_key ('{variant_key}')")
     
-    if variant_key:
+    product_cache_key = (variant_key, identity_key)
+    if variant_key and product_ids is not None and product_cache_key in product_ids:
+        product_id = product_ids[product_cache_key]
+    elif variant_key:
         # Try to resolve existing product
         product_id = resolve_product(conn, variant_key)
         
@@ -1459,10 +1463,10 @@ def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
                 brand=None,  # Could extract from variant_key
                 category=None
             )
+        
+        if product_ids is not None:
+            product_ids[product_cache_key] = product_id
     
-    # ---------------------------------------------------------------------------
-    # 2. Upsert listing
-    # ---------------------------------------------------------------------------
     # PHASE 4.3: Persist both identity_key and variant_key
     identity_key = data.get("_identity_key")  # Canonical identity (no storage/color)
     
@@ -1475,29 +1479,8 @@ def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
             f"   This breaks cross-run aggregation. Check fallback logic in main.py."
         )
     
-    listing_id = upsert_listing(
-        conn,
-        run_id=run_id,
-        platform=platform,
-        source_id=source_id,
-        url=url,
-        title=title,
-        product_id=product_id,
-        image_url=data.get("image_url"),
-        buy_now_price=data.get("buy_now_price"),
-        current_bid=data.get("current_price_ricardo"),
-        bids_count=data.get("bids_count", 0),
-        end_time=data.get("end_time"),
-        location=data.get("location"),
-        shipping_cost=data.get("shipping_cost"),
-        pickup_available=data.get("pickup_available", False),
-        seller_rating=data.get("seller_rating"),
-        identity_key=identity_key,  # PHASE 4.3: Persist canonical identity
-        variant_key=variant_key      # Keep variant_key for compatibility
-    )
-    
     # ---------------------------------------------------------------------------
-    # 3. Insert deal OR bundle
+    # 2. Deal values
     # ---------------------------------------------------------------------------
     is_bundle = data.get("is_bundle", False)
     
@@ -1530,6 +1513,98 @@ def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
     # Price source for audit
     price_source = data.get("price_source", "no_price")
     
+    return {
+        "run_id": run_id,
+        "platform": platform,
+        "source_id": source_id,
+        "url": url,
+        "title": title,
+        "product_id": product_id,
+        "identity_key": identity_key,
+        "variant_key": variant_key,
+        "is_bundle": is_bundle,
+        "cost_estimate": cost_estimate,
+        "market_value": market_value,
+        "expected_profit": expected_profit,
+        "deal_score": deal_score,
+        "strategy": strategy,
+        "strategy_reason": strategy_reason,
+        "price_source": price_source,
+    }
+
+
+def _print_saved(prep: Dict[str, Any]):
+    """Prints the one-line save confirmation for a prepared evaluation."""
+    strategy_icon = {
+        'buy_now': '🔥',
+        'bid_now': '🔥',
+        'watch': '👀',
+        'skip': '⏭️',
+    }.get(prep["strategy"], '💾')
+    
+    type_label = "Bundle" if prep["is_bundle"] else "Deal"
+    print(f"{strategy_icon} Saved {type_label}: {prep['title'][:50]}...")
+
+
+def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Bridge function: Takes old upsert_listing data format and inserts into new v2.2 schema.
+    
+    This handles the full flow:
+    1. Get/create product (from variant_key)
+    2. Upsert listing
+    3. Insert deal OR bundle
+    4. Insert audit record
+    
+    Args:
+        conn: Database connection
+        data: Old format dict with all fields from main.py
+        
+    Returns:
+        Dict with created IDs: {listing_id, product_id, deal_id/bundle_id}
+    """
+    return _save_prepared_evaluation(conn, data, _prepare_evaluation(conn, data))
+
+
+def _save_prepared_evaluation(conn, data: Dict[str, Any], prep: Dict[str, Any]) -> Dict[str, int]:
+    """Per-row write path of save_evaluation() for an already prepared row."""
+    import json
+    
+    run_id = prep["run_id"]
+    product_id = prep["product_id"]
+    is_bundle = prep["is_bundle"]
+    cost_estimate = prep["cost_estimate"]
+    market_value = prep["market_value"]
+    expected_profit = prep["expected_profit"]
+    deal_score = prep["deal_score"]
+    strategy = prep["strategy"]
+    strategy_reason = prep["strategy_reason"]
+    price_source = prep["price_source"]
+    
+    # ---------------------------------------------------------------------------
+    # 3. Upsert listing
+    # ---------------------------------------------------------------------------
+    listing_id = upsert_listing(
+        conn,
+        run_id=run_id,
+        platform=prep["platform"],
+        source_id=prep["source_id"],
+        url=prep["url"],
+        title=prep["title"],
+        product_id=product_id,
+        image_url=data.get("image_url"),
+        buy_now_price=data.get("buy_now_price"),
+        current_bid=data.get("current_price_ricardo"),
+        bids_count=data.get("bids_count", 0),
+        end_time=data.get("end_time"),
+        location=data.get("location"),
+        shipping_cost=data.get("shipping_cost"),
+        pickup_available=data.get("pickup_available", False),
+        seller_rating=data.get("seller_rating"),
+        identity_key=prep["identity_key"],  # PHASE 4.3: Persist canonical identity
+        variant_key=prep["variant_key"]      # Keep variant_key for compatibility
+    )
+    
     result = {
         'listing_id': listing_id,
         'product_id': product_id,
@@ -1537,7 +1612,7 @@ def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
     
     if is_bundle:
         # ---------------------------------------------------------------------------
-        # 3a. Insert bundle
+        # 4a. Insert bundle
         # ---------------------------------------------------------------------------
         bundle_cost = cost_estimate
         bundle_value = data.get("resale_price_bundle") or market_value
@@ -1596,7 +1671,7 @@ def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
         
     else:
         # ---------------------------------------------------------------------------
-        # 3b. Insert deal (single product)
+        # 4b. Insert deal (single product)
         # ---------------------------------------------------------------------------
         deal_id = insert_deal(
             conn,
@@ -1624,26 +1699,113 @@ def save_evaluation(conn, data: Dict[str, Any]) -> Dict[str, int]:
             vision_used=data.get("vision_used", False)
         )
     
-    # ---------------------------------------------------------------------------
-    # 4. Record price history if applicable
-    # ---------------------------------------------------------------------------
     # NOTE: Historical price tracking removed (price_history out of scope)
     # Ricardo only exposes active listings, not ended auctions
     
-    # Print save confirmation
-    strategy_icon = {
-        'buy_now': '🔥',
-        'bid_now': '🔥',
-        'watch': '👀',
-        'skip': '⏭️',
-    }.get(strategy, '💾')
-    
-    type_label = "Bundle" if is_bundle else "Deal"
-    print(f"{strategy_icon} Saved {type_label}: {title[:50]}...")
+    _print_saved(prep)
     
     return result
 
 
+def save_evaluations_bulk(conn, rows: List[Dict[str, Any]], page_size: int = 200) -> List[Dict[str, int]]:
+    """
+    Bulk form of save_evaluation() for one batch of evaluated listings.
+    
+    Products are resolved once per distinct variant; listings, deals and
+    deal audits are each written with one execute_values() statement per
+    page instead of one round-trip per row. Bundles keep the per-row path
+    (bundle items need their bundle_id).
+    
+    A row that fails validation raises ValueError like save_evaluation(),
+    after the rows before it have been written (as with saving one by one).
+    
+    Returns:
+        List of created-ID dicts, in the order of rows
+    """
+    if not rows:
+        return []
+    
+    product_ids: Dict[Tuple[str, str], Optional[int]] = {}
+    preps = []
+    invalid = None
+    for data in rows:
+        try:
+            preps.append(_prepare_evaluation(conn, data, product_ids))
+        except ValueError as e:
+            invalid = e
+            break
+    
+    results: List[Optional[Dict[str, int]]] = [None] * len(preps)
+    deal_rows = []  # (index, data, prep) of single-product evaluations
+    for i, (data, prep) in enumerate(zip(rows, preps)):
+        if prep["is_bundle"]:
+            results[i] = _save_prepared_evaluation(conn, data, prep)
+        else:
+            deal_rows.append((i, data, prep))
+    
+    if deal_rows:
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement:
+        # keep the last row per (platform, source_id), like sequential upserts would
+        listing_values = {}
+        for _, data, prep in deal_rows:
+            listing_values[(prep["platform"], str(prep["source_id"]))] = (
+                prep["run_id"], prep["platform"], prep["source_id"], prep["url"], prep["title"],
+                prep["product_id"], data.get("image_url"),
+                data.get("buy_now_price"), data.get("current_price_ricardo"), data.get("bids_count", 0),
+                data.get("end_time"),
+                data.get("location"), data.get("shipping_cost"), data.get("pickup_available", False),
+                data.get("seller_rating"),
+                prep["identity_key"], prep["variant_key"],
+            )
+        
+        with conn.cursor() as cur:
+            returned = execute_values(
+                cur, _LISTING_UPSERT_PAGE_SQL + "RETURNING platform, source_id, id", list(listing_values.values()),
+                template=_LISTING_UPSERT_TEMPLATE, page_size=page_size, fetch=True)
+            listing_ids = {(platform, str(source_id)): lid for platform, source_id, lid in returned}
+            
+            deal_values = {}
+            for _, data, prep in deal_rows:
+                listing_id = listing_ids[(prep["platform"], str(prep["source_id"]))]
+                deal_values[listing_id] = (
+                    listing_id, prep["product_id"], prep["run_id"],
+                    prep["cost_estimate"], prep["market_value"], prep["expected_profit"],
+                    prep["deal_score"], prep["strategy"], prep["strategy_reason"],
+                )
+            
+            returned = execute_values(
+                cur, _DEAL_UPSERT_PAGE_SQL + "RETURNING listing_id, id", list(deal_values.values()),
+                template=_DEAL_UPSERT_TEMPLATE, page_size=page_size, fetch=True)
+            deal_ids = dict(returned)
+            
+            audit_values = {}
+            for _, data, prep in deal_rows:
+                deal_id = deal_ids[listing_ids[(prep["platform"], str(prep["source_id"]))]]
+                price_source = prep["price_source"]
+                if price_source not in DEAL_AUDIT_PRICE_SOURCES:
+                    price_source = 'no_price'
+                audit_values[deal_id] = (
+                    deal_id, price_source, data.get("ai_cost_usd"),
+                    data.get("cache_hit", False), data.get("web_search_used", False),
+                    data.get("vision_used", False),
+                )
+            
+            execute_values(cur, _DEAL_AUDIT_UPSERT_PAGE_SQL, list(audit_values.values()), page_size=page_size)
+        
+        for i, _, prep in deal_rows:
+            listing_id = listing_ids[(prep["platform"], str(prep["source_id"]))]
+            results[i] = {
+                'listing_id': listing_id,
+                'product_id': prep["product_id"],
+                'deal_id': deal_ids[listing_id],
+            }
+            _print_saved(prep)
+    
+    if invalid is not None:
+        raise invalid
+    return results
+
+
 # Alias for backward compatibility
 def upsert_listing_legacy(conn, data: Dict[str, Any]):
     """
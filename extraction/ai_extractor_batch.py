@@ -11,12 +11,17 @@ STABILIZATION: Safe batch size to prevent token overflow
 - Max batch size: 15 listings (conservative for 4000 token limit)
 - Auto-splitting for larger batches
 - Retry logic for parse failures
+
+DEDUPLICATION: Listings whose title + description are identical up to case
+and whitespace are extracted once; the result is copied to the duplicates.
 """
 
+import copy
+import hashlib
 import json
 import re
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from models.product_spec import ProductSpec
 from models.extracted_product import ExtractedProduct
 from models.bundle_types import BundleType
@@ -175,27 +180,80 @@ def extract_products_batch_safe(
     if not listings:
         return {}
     
+    # Exact-duplicate listings (same normalized title + description) share one extraction
+    unique_listings, duplicates = _dedupe_listings(listings)
+    if duplicates:
+        print(f"   ♻️ {len(duplicates)} duplicate listings reuse an existing extraction")
+    
     # If batch is safe size, process directly
-    if len(listings) <= SAFE_BATCH_SIZE:
-        return extract_products_batch(listings, config)
+    if len(unique_listings) <= SAFE_BATCH_SIZE:
+        results = extract_products_batch(unique_listings, config)
+        _copy_duplicate_results(results, duplicates)
+        return results
     
     # Split into safe batches
-    print(f"   📦 Splitting {len(listings)} listings into batches of {SAFE_BATCH_SIZE}...")
+    print(f"   📦 Splitting {len(unique_listings)} listings into batches of {SAFE_BATCH_SIZE}...")
     results = {}
-    batch_count = (len(listings) + SAFE_BATCH_SIZE - 1) // SAFE_BATCH_SIZE
+    batch_count = (len(unique_listings) + SAFE_BATCH_SIZE - 1) // SAFE_BATCH_SIZE
     
-    for i in range(0, len(listings), SAFE_BATCH_SIZE):
+    for i in range(0, len(unique_listings), SAFE_BATCH_SIZE):
         batch_num = (i // SAFE_BATCH_SIZE) + 1
-        batch = listings[i:i + SAFE_BATCH_SIZE]
+        batch = unique_listings[i:i + SAFE_BATCH_SIZE]
         print(f"   🔄 Processing batch {batch_num}/{batch_count} ({len(batch)} listings)...")
         
         batch_results = extract_products_batch(batch, config)
         results.update(batch_results)
     
+    _copy_duplicate_results(results, duplicates)
     print(f"   ✅ All batches complete: {len(results)}/{len(listings)} extracted")
     return results
 
 
+def _listing_text_key(listing: Dict[str, Any]) -> str:
+    """Hash of what the extraction prompt sees: title + description[:200], lowercased, whitespace-collapsed."""
+    title = " ".join((listing.get("title") or "").lower().split())
+    desc = " ".join((listing.get("description") or "")[:200].lower().split())
+    return hashlib.blake2b(f"{title}\n{desc}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _dedupe_listings(
+    listings: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], str]]]:
+    """
+    Splits listings into (unique listings, [(duplicate listing, representative listing_id)]).
+    The first listing seen for each text key is the representative.
+    """
+    representative_by_key: Dict[str, Optional[str]] = {}
+    unique_listings = []
+    duplicates = []
+    for listing in listings:
+        key = _listing_text_key(listing)
+        # Keyed on presence: a representative's listing_id may itself be None
+        if key in representative_by_key:
+            duplicates.append((listing, representative_by_key[key]))
+        else:
+            representative_by_key[key] = listing.get("listing_id")
+            unique_listings.append(listing)
+    return unique_listings, duplicates
+
+
+def _copy_duplicate_results(
+    results: Dict[str, ExtractedProduct],
+    duplicates: List[Tuple[Dict[str, Any], str]]
+) -> None:
+    """Fills results for duplicate listings from their representative's extraction."""
+    for listing, rep_id in duplicates:
+        rep = results.get(rep_id)
+        if rep is None:
+            results[listing.get("listing_id")] = _create_failed_extraction(listing)
+            continue
+        dup = copy.deepcopy(rep)
+        dup.listing_id = listing.get("listing_id")
+        dup.original_title = listing.get("title", "")
+        dup.ai_cost_usd = 0.0  # no AI call made for this listing
+        results[dup.listing_id] = dup
+
+
 def extract_products_batch(
     listings: List[Dict[str, Any]],
     config=None
@@ -35,14 +35,14 @@ def _interpret_number_in_title(title: str, number: int, unit: str) -> str:
     title_lower = title.lower()
     
     # Explicit weight unit
-    if unit in ["kg", "g", "lbs", "oz", "liter", "ml"]:
+    if unit in {"kg", "g", "lbs", "oz", "liter", "ml"}:
         return "weight"
     
     # Explicit quantity syntax
     if unit == "x":  # "2x iPhone"
         return "quantity"
     
-    if unit in ["stück", "stk", "pieces", "pcs", "teile", "parts"]:
+    if unit in {"stück", "stk", "pieces", "pcs", "teile", "parts"}:
         return "quantity"
     
     # Ambiguous → require detail description
@@ -385,7 +385,7 @@ def _is_fitness_category(
     description: str
 ) -> bool:
     """Detect if listing is fitness-related."""
-    if category and category.lower() in ["fitness", "sport", "krafttraining", "gewichte"]:
+    if category and category.lower() in {"fitness", "sport", "krafttraining", "gewichte"}:
         return True
     
     text = f"{title} {description}".lower()
@@ -663,7 +663,7 @@ def generate_component_identity_key(component: BundleComponent) -> str:
     
     # Add weight for weight-based products
     weight_kg = component.specs.get("weight_kg")
-    if weight_kg and component.product_type in ["hantelscheibe", "kurzhantel", "kettlebell"]:
+    if weight_kg and component.product_type in {"hantelscheibe", "kurzhantel", "kettlebell"}:
         # Normalize weight (5.0 → 5, 2.5 → 2_5)
         if weight_kg == int(weight_kg):
             parts.append(f"{int(weight_kg)}kg")
@@ -672,9 +672,9 @@ def generate_component_identity_key(component: BundleComponent) -> str:
     
     # Add diameter for plates if relevant
     diameter = component.specs.get("diameter_mm")
-    if diameter and diameter in [50, 51]:
+    if diameter and diameter in {50, 51}:
         parts.append("olympic")
-    elif diameter and diameter in [30, 31]:
+    elif diameter and diameter in {30, 31}:
         parts.append("standard")
     
     return "_".join(parts)
@@ -34,11 +34,18 @@ sys.stderr.reconfigure(encoding='utf-8')
 
 import traceback
 import sys
+import gzip
+import os
+import tempfile
+import itertools
 import json
 import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from io import StringIO
+from typing import Any, Dict, List, Optional, Tuple
 
 from playwright.sync_api import sync_playwright
 
@@ -49,6 +56,7 @@ from db_pg_v2 import (
     ensure_schema,
     ensure_schema_v2,
     save_evaluation,  # Bridge function: old format → new schema
+    save_evaluations_bulk,
     cleanup_old_listings,
     clear_listings,
     clean_price_cache as clear_expired_market_data,
@@ -79,7 +87,8 @@ from scrapers.browser_ctx import (
 from scrapers.ricardo import search_ricardo
 from utils_time import parse_ricardo_end_time
 from utils_text import (
-    contains_excluded_terms, 
+    compile_grouped_terms_pattern,
+    compile_terms_pattern,
     normalize_whitespace,
     detect_category,
 )
@@ -111,7 +120,9 @@ from ai_filter import (
     calculate_all_market_resale_prices,
     fetch_variant_info_batch,
     evaluate_listing_with_ai,
+    PRICE_SOURCE_NO_PRICE,
 )
+import ai_filter as _ai_filter  # for run counters that ai_filter rebinds during the run
 
 # v9.2: Enhanced logging
 from logger_utils import get_logger, log_explanation, log_cost_summary
@@ -161,6 +172,88 @@ def _check_web_search_used(variant_info: Optional[Dict], ai_result: Dict) -> boo
     
     return False
 
+_STRATEGY_ICON = {'buy_now': '🔥', 'bid_now': '🔥', 'bid': '💰', 'watch': '👀', 'skip': '⏭️'}
+
+# Phase 4 evaluations are persisted in chunks of this many rows (one bulk save each)
+_SAVE_CHUNK_SIZE = 200
+
+
+def _apply_price_sanity_checks(ai_result: Dict[str, Any], current_price: Optional[float]) -> None:
+    """
+    v10: Data sanity validation before DB insert (mutates ai_result in place).
+    
+    Each price field is read once into a local and only written back when a
+    check actually corrects it.
+    """
+    predicted = ai_result.get("predicted_final_price")
+    resale = ai_result.get("resale_price_est")
+    new_price = ai_result.get("new_price")
+    
+    # Sanity check 1: predicted_final >= current_price
+    if predicted and current_price and predicted < current_price:
+        ai_result["predicted_final_price"] = current_price * 1.1
+    
+    # Sanity check 2: resale_price must be <= new_price
+    if resale and new_price and resale > new_price:
+        resale = new_price * 0.55  # Max 55% of new
+        ai_result["resale_price_est"] = resale
+    
+    # Sanity check 3: If resale exists but new_price is None, estimate new
+    if resale and not new_price:
+        ai_result["new_price"] = round(resale / 0.40, 2)  # Assume 40% resale rate
+
+
+def _no_price_signal_result(is_bundle: bool = False) -> Dict[str, Any]:
+    """
+    Evaluation result for a listing with no variant price, no bid and no
+    buy-now price. Nothing to compute a profit against, so skip without
+    running the evaluator (and its AI/DB lookups).
+    """
+    return {
+        "is_relevant": True,
+        "deal_score": 0.0,
+        "new_price": None,
+        "resale_price_est": None,
+        "expected_profit": 0.0,
+        "transport_car": True,
+        "ai_notes": "",
+        "predicted_final_price": None,
+        "prediction_confidence": None,
+        "is_bundle": is_bundle,
+        "bundle_components": None,
+        "resale_price_bundle": None,
+        "recommended_strategy": "skip",
+        "strategy_reason": "No price signal (no variant price, bid or buy-now price)",
+        "market_based_resale": False,
+        "market_sample_size": 0,
+        "market_value": None,
+        "price_source": PRICE_SOURCE_NO_PRICE,
+        "buy_now_ceiling": None,
+        "market_source": None,
+    }
+
+
+def _evaluate_prepared(item: Tuple) -> Dict[str, Any]:
+    """Phase 4 worker: evaluates one (listing, variant_info, batch_bundle_result, eval_kwargs) item."""
+    _, _, batch_bundle_result, eval_kwargs = item
+    if eval_kwargs is None:
+        return _no_price_signal_result(is_bundle=bool(batch_bundle_result))
+    return evaluate_listing_with_ai(**eval_kwargs)
+
+
+def _evaluate_prepared_captured(item: Tuple) -> Tuple[Dict[str, Any], str]:
+    """
+    Pool variant of _evaluate_prepared(): returns (result, printed output) so the
+    consumer can replay each listing's log in order instead of interleaving it.
+    """
+    stdout = sys.stdout
+    if not isinstance(stdout, TeeOutput):
+        return _evaluate_prepared(item), ""
+    with stdout.capture() as captured:
+        result = _evaluate_prepared(item)
+    return result, "".join(captured)
+
+
 # Detail scraper integration
 try:
     from scrapers.detail_scraper import scrape_detail_page
@@ -175,6 +268,13 @@ try:
 except ImportError:
     VISION_AVAILABLE = False
 
+# Fast JSON encoding for exports (optional - falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ==============================================================================
 # v9 PIPELINE HELPER FUNCTIONS
@@ -238,6 +338,12 @@ def run_v10_pipeline(
     all_listings_by_query: Dict[str, List[Dict[str, Any]]] = {}
     query_categories: Dict[str, str] = {}
     
+    # Pre-filter term lists compiled once: one regex scan per title instead of one per term
+    exclude_re = compile_terms_pattern(cfg.general.exclude_terms)
+    
+    # Same listing can show up on several result pages or for several queries
+    seen_listing_ids = set()
+    
     for query in queries:
         logger.step_progress(f"Scraping query: '{query}'")
         
@@ -253,36 +359,50 @@ def run_v10_pipeline(
         # Scrape listings
         listings = []
         skipped_count = 0
+        # Exclude + defect terms in one pattern: titles that pass (the common case) are scanned once
+        prefilter_re = compile_grouped_terms_pattern({
+            "exclude": cfg.general.exclude_terms,
+            "defect": get_defect_keywords(query_analysis),
+        })
+        
+        def title_filter(title: str) -> bool:
+            nonlocal skipped_count
+            global_stats["total_scraped"] += 1
+            if prefilter_re is None:
+                return True
+            title_lower = normalize_whitespace(title).lower()
+            
+            # PRE-FILTERS (same as v7)
+            # v12: Accessory filter now integrated in AI extraction (no separate call needed)
+            # Filtering happens in pipeline_runner.py after extraction
+            match = prefilter_re.search(title_lower)
+            if match is None:
+                return True
+            
+            # Exclude terms take precedence over defects for accounting, wherever they occur
+            if match.lastgroup == "exclude" or (exclude_re is not None and exclude_re.search(title_lower)):
+                global_stats["skipped_exclude"] += 1
+            else:
+                global_stats["skipped_defect"] += 1
+            skipped_count += 1
+            return False
         
         try:
+            # Pre-filters run inside the scraper, before a rejected card is parsed
             for listing in search_ricardo(
                 query=query,
                 context=context,
                 ua=cfg.general.user_agent,
                 timeout_sec=cfg.general.request_timeout_sec,
                 max_pages=cfg.general.max_pages_list,
+                title_filter=title_filter,
             ):
-                global_stats["total_scraped"] += 1
-                
-                title = listing.get("title") or ""
-                normalized_title = normalize_whitespace(title)
-                title_lower = normalized_title.lower()
-                
-                # PRE-FILTERS (same as v7)
-                if contains_excluded_terms(title_lower, cfg.general.exclude_terms):
-                    global_stats["skipped_exclude"] += 1
-                    skipped_count += 1
-                    continue
-                
-                # v12: Accessory filter now integrated in AI extraction (no separate call needed)
-                # Filtering happens in pipeline_runner.py after extraction
-                
-                # Defect filter
-                defect_kw = get_defect_keywords(query_analysis)
-                if defect_kw and contains_excluded_terms(title_lower, defect_kw):
-                    global_stats["skipped_defect"] += 1
+                lid = listing.get("listing_id")
+                if lid in seen_listing_ids:
+                    global_stats["skipped_duplicate"] += 1
                     skipped_count += 1
                     continue
+                seen_listing_ids.add(lid)
                 
                 # Store query reference for later
                 listing["_query"] = query
@@ -301,7 +421,7 @@ def run_v10_pipeline(
         
         logger.step_success(f"Scraped '{query}'", count=len(listings))
         if skipped_count > 0:
-            logger.step_logic(f"Pre-filtered {skipped_count} listings (accessories, defects, excluded terms)")
+            logger.step_logic(f"Pre-filtered {skipped_count} listings (accessories, defects, excluded terms, duplicates)")
         all_listings_by_query[query] = listings
     
     # Count totals
@@ -322,30 +442,14 @@ def run_v10_pipeline(
         logger.step_warning("No listings found across all queries")
         return []
     
-    # Convert to format expected by new pipeline
+    # Flat view for the new pipeline: the same listing dicts, not copies, so fields
+    # set during extraction (identity keys etc.) are visible through both views
     all_listings_flat = []
     for query, listings in all_listings_by_query.items():
         for listing in listings:
-            current_price = listing.get("current_price_ricardo")
-            all_listings_flat.append({
-                "listing_id": listing.get("listing_id", ""),
-                "title": listing.get("title", ""),
-                "description": listing.get("description", ""),
-                "url": listing.get("url", ""),
-                "image_url": listing.get("image_url"),
-                "image_urls": listing.get("image_urls", []),
-                "current_price_ricardo": current_price,
-                "current_bid": current_price,  # 🔧 ALIAS FIX: Market price calculation expects "current_bid"
-                "buy_now_price": listing.get("buy_now_price"),
-                "bids_count": listing.get("bids_count"),
-                "hours_remaining": listing.get("hours_remaining"),
-                "end_time_text": listing.get("end_time_text"),
-                "location": listing.get("location"),
-                "postal_code": listing.get("postal_code"),
-                "shipping": listing.get("shipping"),
-                "_query": listing.get("_query"),
-                "_category": listing.get("_category"),
-            })
+            listing["current_bid"] = listing.get("current_price_ricardo")  # 🔧 ALIAS FIX: Market price calculation expects "current_bid"
+            listing.setdefault("image_urls", [])
+            all_listings_flat.append(listing)
     
     # =========================================================================
     # PHASE 2: QUERY-AGNOSTIC PRODUCT EXTRACTION
@@ -546,19 +650,8 @@ def run_v10_pipeline(
     if invalid_count > 0:
         logger.step_warning(f"{invalid_count} listings could not be extracted (skipped or too unclear)")
     
-    # CRITICAL FIX: Update all_listings_flat with extracted identity_key
-    # Market price calculation needs _identity_key for aggregation
-    for flat_listing in all_listings_flat:
-        listing_id = flat_listing.get("listing_id")
-        # Find matching listing from extraction phase
-        for query, listings in all_listings_by_query.items():
-            for listing in listings:
-                if listing.get("listing_id") == listing_id:
-                    # Copy extracted fields to flat listing
-                    flat_listing["_identity_key"] = listing.get("_identity_key")
-                    flat_listing["variant_key"] = listing.get("variant_key")
-                    flat_listing["_final_search_name"] = listing.get("_final_search_name")
-                    break
+    # all_listings_flat shares the listing dicts, so _identity_key / variant_key /
+    # _final_search_name set above are already there for market price aggregation
     
     # =========================================================================
     # PHASE 3: WEBSEARCH QUERY GENERATION & PRICE FETCHING
@@ -579,7 +672,7 @@ def run_v10_pipeline(
     )
     
     # Generate websearch queries for all extracted products
-    websearch_queries = []
+    websearch_query_count = 0
     product_key_to_query = {}
     final_search_name_to_product_key = {}  # CRITICAL: Map final_search_name -> product_key for price lookup
     
@@ -600,12 +693,13 @@ def run_v10_pipeline(
             if canonical_key not in identity_to_query:
                 identity_to_query[canonical_key] = query.primary_query
             
-            websearch_queries.append(query.primary_query)
+            websearch_query_count += 1
             product_key_to_query[identity.product_key] = query
             final_search_name_to_product_key[final_search_name] = identity.product_key
     
-    # Use deduplicated identity-based queries
-    unique_queries = list(identity_to_query.values())
+    # Use deduplicated identity-based queries (distinct identities can share a query string;
+    # dict.fromkeys drops those repeats and keeps first-seen order)
+    unique_queries = list(dict.fromkeys(identity_to_query.values()))
     
     logger.step_result(
         summary=f"Generated {len(unique_queries)} unique websearch queries",
@@ -613,7 +707,7 @@ def run_v10_pipeline(
             "Products extracted": len(extracted_products),
             "Can be priced": len([ep for ep in extracted_products if ep.can_price]),
             "Unique queries": len(unique_queries),
-            "Deduplication": f"{(1 - len(unique_queries)/max(len(websearch_queries), 1))*100:.0f}%",
+            "Deduplication": f"{(1 - len(unique_queries)/max(websearch_query_count, 1))*100:.0f}%",
         },
     )
     
@@ -655,24 +749,39 @@ def run_v10_pipeline(
     first_query = queries[0] if queries else ""
     first_analysis = query_analyses.get(first_query)
     
-    market_prices = calculate_all_market_resale_prices(
-        listings=all_listings_flat,
-        variant_new_prices=None,
-        unrealistic_floor=get_min_realistic_price(first_analysis),
-        typical_multiplier=get_auction_multiplier(first_analysis),
-        context=context,
-        ua=cfg.general.user_agent,
-        query_analysis=first_analysis,
-        conn=conn,
-        run_id=run_id,
-    )
+    # Market pricing groups by _identity_key; without any there is nothing to aggregate
+    if any(l.get("_identity_key") for l in all_listings_flat):
+        market_prices = calculate_all_market_resale_prices(
+            listings=all_listings_flat,
+            variant_new_prices=None,
+            unrealistic_floor=get_min_realistic_price(first_analysis),
+            typical_multiplier=get_auction_multiplier(first_analysis),
+            context=context,
+            ua=cfg.general.user_agent,
+            query_analysis=first_analysis,
+            conn=conn,
+            run_id=run_id,
+        )
+    else:
+        print("   ⏭️ No product identities extracted - skipping market pricing")
+        market_prices = {}
     
     logger.step_success(f"Market prices calculated", count=len(market_prices))
     logger.step_logic(f"Market prices are from past Ricardo auctions with bids (free - no AI costs)")
     
     # OBSERVABILITY: Warn if bids exist but market pricing returned 0 results
-    total_bids = sum(l.get("bids_count", 0) for l in all_listings_flat)
-    listings_with_bids = sum(1 for l in all_listings_flat if l.get("bids_count", 0) > 0)
+    # Single pass over all_listings_flat: bid stats + same-run soft market index for Phase 4
+    total_bids = 0
+    listings_with_bids = 0
+    same_run_by_identity: Dict[str, List[Dict[str, Any]]] = {}
+    for l in all_listings_flat:
+        bids = l.get("bids_count", 0)
+        total_bids += bids
+        if bids > 0:
+            listings_with_bids += 1
+        identity_key = l.get("_identity_key")
+        if identity_key and l.get("current_bid"):
+            same_run_by_identity.setdefault(identity_key, []).append(l)
     
     if total_bids > 0 and len(market_prices) == 0:
         print(f"\n   🚨 WARNING: LIVE BID DATA IGNORED")
@@ -701,15 +810,18 @@ def run_v10_pipeline(
     
     # FIXED: Pass live bid count as market signal for websearch validation
     # Count actual listings with bids_count > 0 (not just market_prices)
-    live_bid_count = sum(1 for l in all_listings_flat if l.get("bids_count", 0) > 0)
-    
-    variant_info_map = fetch_variant_info_batch(
-        variant_keys=unique_queries,
-        car_model=car_model,
-        market_prices=market_prices,
-        query_analysis=first_analysis,
-        live_bid_count=live_bid_count,
-    )
+    live_bid_count = listings_with_bids
+    
+    if unique_queries:
+        variant_info_map = fetch_variant_info_batch(
+            variant_keys=unique_queries,
+            car_model=car_model,
+            market_prices=market_prices,
+            query_analysis=first_analysis,
+            live_bid_count=live_bid_count,
+        )
+    else:
+        variant_info_map = {}
     
     # CRITICAL FIX: Build price_map keyed by final_search_name for stable lookup
     # Old mapping: query_str -> product_key (BROKEN - query_str != product_key)
@@ -717,18 +829,24 @@ def run_v10_pipeline(
     price_map_by_final_search_name = {}
     variant_info_by_key = {}  # Keep for backward compatibility
     
+    # Reverse indexes (first match wins, same as the old nested scans)
+    query_str_to_product_key = {}
+    for pk, query_obj in product_key_to_query.items():
+        query_str_to_product_key.setdefault(query_obj.primary_query, pk)
+    product_key_to_final_search_name = {}
+    for final_search_name, mapped_pk in final_search_name_to_product_key.items():
+        product_key_to_final_search_name.setdefault(mapped_pk, final_search_name)
+    
     for query_str, info in variant_info_map.items():
-        # Find matching product key via query object
-        for pk, query_obj in product_key_to_query.items():
-            if query_obj.primary_query == query_str:
-                variant_info_by_key[pk] = info
-                
-                # CRITICAL: Also map by final_search_name for stable price lookup
-                for final_search_name, mapped_pk in final_search_name_to_product_key.items():
-                    if mapped_pk == pk:
-                        price_map_by_final_search_name[final_search_name] = info
-                        break
-                break
+        pk = query_str_to_product_key.get(query_str)
+        if pk is None:
+            continue
+        variant_info_by_key[pk] = info
+        
+        # CRITICAL: Also map by final_search_name for stable price lookup
+        final_search_name = product_key_to_final_search_name.get(pk)
+        if final_search_name is not None:
+            price_map_by_final_search_name[final_search_name] = info
     
     # =========================================================================
     # LIVE-MARKET-FIRST PRICING (No historical learning available)
@@ -788,348 +906,373 @@ def run_v10_pipeline(
         fallback="If AI fails: simple profit formula without quality adjustments",
     )
     
-    for query, listings in all_listings_by_query.items():
-        if not listings:
-            continue
+    eval_workers = max(1, getattr(cfg.ai, "eval_workers", 1))
+    eval_pool = ThreadPoolExecutor(max_workers=eval_workers, thread_name_prefix="ai_eval") if eval_workers > 1 else None
+    
+    try:
+        for query, listings in all_listings_by_query.items():
+            if not listings:
+                continue
             
-        query_analysis = query_analyses.get(query)
-        category = query_categories[query]
-        deals_this_query = []
+            query_analysis = query_analyses.get(query)
+            category = query_categories[query]
+            deals_this_query = []
         
-        print(f"\n📋 Evaluating {len(listings)} listings for '{query}'")
+            print(f"\n📋 Evaluating {len(listings)} listings for '{query}'")
         
-        for listing in listings:
-            title = listing.get("title", "")
-            variant_key = listing.get("variant_key")
-            final_search_name = listing.get("_final_search_name")
+            def _prepare_listing(listing: Dict[str, Any]) -> Tuple:
+                """Price lookup, bundle and soft-market setup for one listing (main thread)."""
+                title = listing.get("title", "")
+                variant_key = listing.get("variant_key")
+                final_search_name = listing.get("_final_search_name")
             
-            current_price = listing.get("current_price_ricardo")
-            buy_now = listing.get("buy_now_price")
-            bids_count = listing.get("bids_count")
-            hours_remaining = listing.get("hours_remaining")
+                current_price = listing.get("current_price_ricardo")
+                buy_now = listing.get("buy_now_price")
+                bids_count = listing.get("bids_count")
+                hours_remaining = listing.get("hours_remaining")
             
-            # PHASE 2: PRICE LOOKUP CHAIN WITH STRUCTURED LOGGING
-            # Track which price source was used for observability
-            variant_info = None  # Initialize to avoid UnboundLocalError
-            price_lookup_path = []
+                # PHASE 2: PRICE LOOKUP CHAIN WITH STRUCTURED LOGGING
+                # Track which price source was used for observability
+                variant_info = None  # Initialize to avoid UnboundLocalError
+                price_lookup_path = []
             
-            # Primary: final_search_name (most reliable)
-            if final_search_name:
-                price_lookup_path.append(f"final_search_name='{final_search_name}'")
-                variant_info = price_map_by_final_search_name.get(final_search_name)
-                if variant_info:
-                    print(f"   ✅ PRICE LOOKUP: final_search_name → {variant_info.get('price_source', 'unknown')}")
+                # Primary: final_search_name (most reliable)
+                if final_search_name:
+                    price_lookup_path.append(f"final_search_name='{final_search_name}'")
+                    variant_info = price_map_by_final_search_name.get(final_search_name)
+                    if variant_info:
+                        print(f"   ✅ PRICE LOOKUP: final_search_name → {variant_info.get('price_source', 'unknown')}")
             
-            # Fallback 1: variant_key
-            if not variant_info and variant_key:
-                price_lookup_path.append(f"variant_key='{variant_key}'")
-                variant_info = variant_info_by_key.get(variant_key)
-                if variant_info:
-                    print(f"   ✅ PRICE LOOKUP: variant_key → {variant_info.get('price_source', 'unknown')}")
+                # Fallback 1: variant_key
+                if not variant_info and variant_key:
+                    price_lookup_path.append(f"variant_key='{variant_key}'")
+                    variant_info = variant_info_by_key.get(variant_key)
+                    if variant_info:
+                        print(f"   ✅ PRICE LOOKUP: variant_key → {variant_info.get('price_source', 'unknown')}")
             
-            # Log failure path if no price found
-            if not variant_info:
-                print(f"   ❌ PRICE LOOKUP FAILED: Tried {' → '.join(price_lookup_path)}")
+                # Log failure path if no price found
+                if not variant_info:
+                    print(f"   ❌ PRICE LOOKUP FAILED: Tried {' → '.join(price_lookup_path)}")
             
-            # DEFENSIVE INTEGRITY GUARD: If variant_info is still None AND buy_now_price exists
-            # Create minimal variant_info to GUARANTEE new_price is populated
-            # NOTE: Fallback also exists in ai_filter.py:2163-2166, but artifacts prove it's not reliably executed
-            # This is intentionally redundant until root cause is identified and hardened
-            if not variant_info and buy_now:
-                variant_info = {
-                    "new_price": buy_now * 1.1,  # Conservative estimate: 10% markup
-                    "price_source": "buy_now_fallback",
-                    "transport_car": True,
-                    "market_based": False,
-                    "market_sample_size": 0,
-                }
-                print(f"   💰 Using buy_now_price as fallback: {variant_info['new_price']:.2f} CHF")
+                # DEFENSIVE INTEGRITY GUARD: If variant_info is still None AND buy_now_price exists
+                # Create minimal variant_info to GUARANTEE new_price is populated
+                # NOTE: Fallback also exists in ai_filter.py:2163-2166, but artifacts prove it's not reliably executed
+                # This is intentionally redundant until root cause is identified and hardened
+                if not variant_info and buy_now:
+                    variant_info = {
+                        "new_price": buy_now * 1.1,  # Conservative estimate: 10% markup
+                        "price_source": "buy_now_fallback",
+                        "transport_car": True,
+                        "market_based": False,
+                        "market_sample_size": 0,
+                    }
+                    print(f"   💰 Using buy_now_price as fallback: {variant_info['new_price']:.2f} CHF")
             
-            # v10: Use query-agnostic bundle detection result
-            is_bundle = listing.get("_is_bundle", False)
-            bundle_type = listing.get("_bundle_type", BundleType.SINGLE_PRODUCT)
-            products = listing.get("_products", [])
-            quantity = listing.get("_quantity", 1)
+                # v10: Use query-agnostic bundle detection result
+                is_bundle = listing.get("_is_bundle", False)
+                bundle_type = listing.get("_bundle_type", BundleType.SINGLE_PRODUCT)
+                products = listing.get("_products", [])
+                quantity = listing.get("_quantity", 1)
             
-            # Create batch_bundle_result from query-agnostic detection
-            batch_bundle_result = None
-            if is_bundle and products:
-                batch_bundle_result = {
-                    "is_bundle": True,
-                    "bundle_type": bundle_type.value if hasattr(bundle_type, 'value') else str(bundle_type),
-                    "components": [
-                        {"name": p.product_type, "quantity": 1}
-                        for p in products
-                    ],
-                    "pricing_method": get_pricing_method(bundle_type).value if hasattr(bundle_type, 'value') else "unknown",
-                }
+                # Create batch_bundle_result from query-agnostic detection
+                batch_bundle_result = None
+                if is_bundle and products:
+                    batch_bundle_result = {
+                        "is_bundle": True,
+                        "bundle_type": bundle_type.value if hasattr(bundle_type, 'value') else str(bundle_type),
+                        "components": [
+                            {"name": p.product_type, "quantity": 1}
+                            for p in products
+                        ],
+                        "pricing_method": get_pricing_method(bundle_type).value if hasattr(bundle_type, 'value') else "unknown",
+                    }
             
-            # FIX 3 & 4: Soft market using canonical identity_key + same-run listings
-            # Canonical key normalizes generations, excludes color/condition for better aggregation
-            all_listings_for_variant = []
-            identity_key = listing.get("_identity_key")  # Canonical normalized identity
-            print(f"   🔑 IDENTITY_KEY: '{identity_key}' for listing {listing.get('listing_id')}")
-            if identity_key:
-                # Fetch persisted listings from DB
-                persisted = get_listings_by_search_identity(conn, run_id, identity_key)
-                print(f"   🔍 SOFT MARKET QUERY: identity_key='{identity_key}', persisted={len(persisted) if persisted else 0}")
-                if persisted:
-                    all_listings_for_variant.extend(persisted)
+                # Short-circuit: nothing to price against -> skip without evaluation
+                eval_kwargs = None
+                if not variant_info and not current_price and not buy_now:
+                    print(f"   ⏭️ NO PRICE SIGNAL: skipping evaluation for listing {listing.get('listing_id')}")
+                else:
+                    # FIX 3 & 4: Soft market using canonical identity_key + same-run listings
+                    # Canonical key normalizes generations, excludes color/condition for better aggregation
+                    all_listings_for_variant = []
+                    identity_key = listing.get("_identity_key")  # Canonical normalized identity
+                    print(f"   🔑 IDENTITY_KEY: '{identity_key}' for listing {listing.get('listing_id')}")
+                    if identity_key:
+                        # Fetch persisted listings from DB
+                        persisted = get_listings_by_search_identity(conn, run_id, identity_key)
+                        print(f"   🔍 SOFT MARKET QUERY: identity_key='{identity_key}', persisted={len(persisted) if persisted else 0}")
+                        if persisted:
+                            all_listings_for_variant.extend(persisted)
                 
-                # FIX 4: Include same-run listings (enables soft market within same run)
-                same_run_listings = [
-                    l for l in all_listings_flat 
-                    if l.get("_identity_key") == identity_key and l.get("current_bid")
-                ]
-                all_listings_for_variant.extend(same_run_listings)
-                print(f"   📊 SOFT MARKET DATA: total_listings={len(all_listings_for_variant)}, same_run={len(same_run_listings)}")
+                        # FIX 4: Include same-run listings (enables soft market within same run)
+                        same_run_listings = same_run_by_identity.get(identity_key, [])
+                        all_listings_for_variant.extend(same_run_listings)
+                        print(f"   📊 SOFT MARKET DATA: total_listings={len(all_listings_for_variant)}, same_run={len(same_run_listings)}")
             
-            # Use identity_key as search_identity for soft market
-            search_identity = identity_key
-            
-            # Evaluate (OBJECTIVE B: pass variant_info_by_key for bundle component pricing)
-            ai_result = evaluate_listing_with_ai(
-                title=title,
-                description=listing.get("description") or "",
-                current_price=current_price,
-                buy_now_price=buy_now,
-                image_url=listing.get("image_url"),
-                query=query,
-                variant_key=variant_key,
-                variant_info=variant_info,
-                bids_count=bids_count,
-                hours_remaining=hours_remaining,
-                base_product=query,
-                context=context,
-                ua=cfg.general.user_agent,
-                query_analysis=query_analysis,
-                batch_bundle_result=batch_bundle_result,
-                variant_info_by_key=variant_info_by_key,
-                quantity=quantity,
-                all_listings_for_variant=all_listings_for_variant,
-                search_identity=search_identity,  # AI-normalized identity for Soft Market
-                conn=conn,  # Database connection for bundle pricing
-                run_id=run_id,  # Run ID for bundle pricing
-            )
+                    # Use identity_key as search_identity for soft market
+                    search_identity = identity_key
             
-            # Log result with comprehensive details for analysis
-            profit = ai_result.get("expected_profit") or 0.0
-            score = ai_result.get("deal_score")
-            strategy = ai_result.get("recommended_strategy") or 'skip'
-            price_source = ai_result.get("price_source") or "unknown"
-            is_bundle = ai_result.get("is_bundle", False)
-            new_price = ai_result.get("new_price") or 0.0
-            resale_price = ai_result.get("resale_price_est") or 0.0
-            
-            # DEFENSIVE: Validate score is numeric before formatting
-            if score is None or not isinstance(score, (int, float)):
-                print(f"   ⚠️ SCORE MISSING: deal_score={score} for '{title[:50]}' - defaulting to 0.0")
-                score = 0.0
+                    # Evaluate (OBJECTIVE B: pass variant_info_by_key for bundle component pricing)
+                    # Evaluated below, possibly on the AI worker pool
+                    eval_kwargs = dict(
+                        title=title,
+                        description=listing.get("description") or "",
+                        current_price=current_price,
+                        buy_now_price=buy_now,
+                        image_url=listing.get("image_url"),
+                        query=query,
+                        variant_key=variant_key,
+                        variant_info=variant_info,
+                        bids_count=bids_count,
+                        hours_remaining=hours_remaining,
+                        base_product=query,
+                        context=context,
+                        ua=cfg.general.user_agent,
+                        query_analysis=query_analysis,
+                        batch_bundle_result=batch_bundle_result,
+                        variant_info_by_key=variant_info_by_key,
+                        quantity=quantity,
+                        all_listings_for_variant=all_listings_for_variant,
+                        search_identity=search_identity,  # AI-normalized identity for Soft Market
+                        conn=conn,  # Database connection for bundle pricing
+                        run_id=run_id,  # Run ID for bundle pricing
+                    )
             
-            strategy_icon = {'buy_now': '🔥', 'bid_now': '🔥', 'bid': '💰', 'watch': '👀', 'skip': '⏭️'}.get(strategy, '❓')
-            # Enhanced logging for perfect analysis
-            print(f"   {strategy_icon} {title}")
-            print(f"      💰 Profit: {profit:.2f} CHF | 📊 Score: {score:.1f}/10 | 🏷️ Source: {price_source}")
-            print(f"      💵 New: {fmt_price(new_price)} CHF | 🔄 Resale: {fmt_price(resale_price)} CHF | 📦 Bundle: {'Yes' if is_bundle else 'No'}")
-            if variant_info and variant_info.get("shop_name"):
-                print(f"      🏪 Shops: {variant_info.get('shop_name')}")
-            if is_bundle and ai_result.get("bundle_components"):
-                print(f"      📦 Components: {len(ai_result.get('bundle_components', []))} items")
+                return (listing, variant_info, batch_bundle_result, eval_kwargs)
+        
+            if eval_pool:
+                # AI calls are network-bound: with eval_workers > 1 they overlap on the pool,
+                # while results are still consumed (logged + persisted) in listing order.
+                prepared = [_prepare_listing(listing) for listing in listings]
+                evaluated = zip(prepared, eval_pool.map(_evaluate_prepared_captured, prepared))
+            else:
+                # Lazy: each listing is prepared, evaluated and logged before the next one
+                evaluated = ((item, (_evaluate_prepared(item), "")) for item in map(_prepare_listing, listings))
+        
+            pending_saves = []
+            try:
+                for (listing, variant_info, _, _), (ai_result, eval_log) in evaluated:
+                    if eval_log:
+                        # Worker output, replayed whole so it cannot interleave with other listings
+                        sys.stdout.write(eval_log)
+                    title = listing.get("title", "")
+                    variant_key = listing.get("variant_key")
+                    buy_now = listing.get("buy_now_price")
+                    bids_count = listing.get("bids_count")
+                    hours_remaining = listing.get("hours_remaining")
             
-            # Save to database
-            end_time = parse_ricardo_end_time(listing.get("end_time_text"))
+                    # Log result with comprehensive details for analysis
+                    profit = ai_result.get("expected_profit") or 0.0
+                    score = ai_result.get("deal_score")
+                    strategy = ai_result.get("recommended_strategy") or 'skip'
+                    price_source = ai_result.get("price_source") or "unknown"
+                    is_bundle = ai_result.get("is_bundle", False)
+                    new_price = ai_result.get("new_price") or 0.0
+                    resale_price = ai_result.get("resale_price_est") or 0.0
             
-            # v2.2: price_history recording moved to save_evaluation() - happens after listing insert
+                    # DEFENSIVE: Validate score is numeric before formatting
+                    if score is None or not isinstance(score, (int, float)):
+                        print(f"   ⚠️ SCORE MISSING: deal_score={score} for '{title[:50]}' - defaulting to 0.0")
+                        score = 0.0
             
-            # SEMANTICS: price_source describes the source of the RESALE PRICE
-            # - web_search_used=true means websearch was used for NEW PRICE (reference value)
-            # - price_source=market_* means RESALE PRICE comes from Ricardo auction data
-            # Both can be true simultaneously: websearch for new_price, market for resale_price
-            price_source = ai_result.get("price_source", "ai_estimate")
-            if ai_result.get("market_based_resale"):
-                price_source = ai_result.get("market_source", "market_auction")
+                    strategy_icon = _STRATEGY_ICON.get(strategy, '❓')
+                    # Enhanced logging for perfect analysis (one write per listing)
+                    result_lines = [
+                        f"   {strategy_icon} {title}",
+                        f"      💰 Profit: {profit:.2f} CHF | 📊 Score: {score:.1f}/10 | 🏷️ Source: {price_source}",
+                        f"      💵 New: {fmt_price(new_price)} CHF | 🔄 Resale: {fmt_price(resale_price)} CHF | 📦 Bundle: {'Yes' if is_bundle else 'No'}",
+                    ]
+                    if variant_info and variant_info.get("shop_name"):
+                        result_lines.append(f"      🏪 Shops: {variant_info.get('shop_name')}")
+                    if is_bundle and ai_result.get("bundle_components"):
+                        result_lines.append(f"      📦 Components: {len(ai_result.get('bundle_components', []))} items")
+                    print("\n".join(result_lines))
             
-            # v10: Data sanity validation before DB insert
-            current_price = listing.get("current_price_ricardo") or listing.get("price")
-            predicted = ai_result.get("predicted_final_price")
-            resale = ai_result.get("resale_price_est")
-            new_price = ai_result.get("new_price")
+                    # Save to database
+                    end_time = parse_ricardo_end_time(listing.get("end_time_text"))
             
-            # Sanity check 1: predicted_final >= current_price
-            if predicted and current_price and predicted < current_price:
-                predicted = current_price * 1.1
-                ai_result["predicted_final_price"] = predicted
+                    # v2.2: price_history recording moved to save_evaluation() - happens after listing insert
             
-            # Sanity check 2: resale_price must be <= new_price
-            if resale and new_price and resale > new_price:
-                resale = new_price * 0.55  # Max 55% of new
-                ai_result["resale_price_est"] = resale
+                    # SEMANTICS: price_source describes the source of the RESALE PRICE
+                    # - web_search_used=true means websearch was used for NEW PRICE (reference value)
+                    # - price_source=market_* means RESALE PRICE comes from Ricardo auction data
+                    # Both can be true simultaneously: websearch for new_price, market for resale_price
+                    price_source = ai_result.get("price_source", "ai_estimate")
+                    if ai_result.get("market_based_resale"):
+                        price_source = ai_result.get("market_source", "market_auction")
             
-            # Sanity check 3: If resale exists but new_price is None, estimate new
-            if resale and not new_price:
-                new_price = resale / 0.40  # Assume 40% resale rate
-                ai_result["new_price"] = round(new_price, 2)
+                    # v10: Data sanity validation before DB insert
+                    current_price = listing.get("current_price_ricardo") or listing.get("price")
+                    _apply_price_sanity_checks(ai_result, current_price)
             
-            # FIX #2: BAN price_source='unknown' - Hard safety net at DB persistence
-            # If price_source is still 'unknown', this is data corruption - replace with query_baseline
-            # This should NEVER happen after FIX #1, but acts as final defense layer
-            if price_source == "unknown":
-                print(f"   🚨 SAFETY NET: Replacing price_source='unknown' with 'query_baseline' for {listing['listing_id']}")
-                price_source = "query_baseline"
+                    # FIX #2: BAN price_source='unknown' - Hard safety net at DB persistence
+                    # If price_source is still 'unknown', this is data corruption - replace with query_baseline
+                    # This should NEVER happen after FIX #1, but acts as final defense layer
+                    if price_source == "unknown":
+                        print(f"   🚨 SAFETY NET: Replacing price_source='unknown' with 'query_baseline' for {listing['listing_id']}")
+                        price_source = "query_baseline"
                 
-                # Ensure prices are not NULL - use query baseline if needed
-                if not ai_result.get("new_price") or not ai_result.get("resale_price_est"):
-                    from ai_filter import _get_new_price_estimate, _get_resale_rate
-                    baseline_new = _get_new_price_estimate(query_analysis)
-                    baseline_resale_rate = _get_resale_rate(query_analysis)
-                    quantity = listing.get("_quantity", 1)
+                        # Ensure prices are not NULL - use query baseline if needed
+                        if not ai_result.get("new_price") or not ai_result.get("resale_price_est"):
+                            from ai_filter import _get_new_price_estimate, _get_resale_rate
+                            baseline_new = _get_new_price_estimate(query_analysis)
+                            baseline_resale_rate = _get_resale_rate(query_analysis)
+                            quantity = listing.get("_quantity", 1)
                     
-                    if not ai_result.get("new_price"):
-                        ai_result["new_price"] = round(baseline_new, 2)
-                    if not ai_result.get("resale_price_est"):
-                        ai_result["resale_price_est"] = round(baseline_new * baseline_resale_rate * quantity, 2)
+                            if not ai_result.get("new_price"):
+                                ai_result["new_price"] = round(baseline_new, 2)
+                            if not ai_result.get("resale_price_est"):
+                                ai_result["resale_price_est"] = round(baseline_new * baseline_resale_rate * quantity, 2)
                     
-                    print(f"      Applied baseline: new={fmt_price(ai_result['new_price'])}, resale={fmt_price(ai_result['resale_price_est'])} CHF")
+                            print(f"      Applied baseline: new={fmt_price(ai_result['new_price'])}, resale={fmt_price(ai_result['resale_price_est'])} CHF")
             
-            # CRITICAL: Normalize bundle_components to JSON string if it's a dict/list
-            import json
-            bundle_components_raw = ai_result.get("bundle_components")
-            if isinstance(bundle_components_raw, (dict, list)):
-                bundle_components_json = json.dumps(bundle_components_raw, ensure_ascii=False)
-            else:
-                bundle_components_json = bundle_components_raw
+                    # CRITICAL: Normalize bundle_components to JSON string if it's a dict/list
+                    import json
+                    bundle_components_raw = ai_result.get("bundle_components")
+                    if isinstance(bundle_components_raw, (dict, list)):
+                        bundle_components_json = json.dumps(bundle_components_raw, ensure_ascii=False)
+                    else:
+                        bundle_components_json = bundle_components_raw
             
-            # CRITICAL: Generate unique INTEGER bundle_id for TRUE bundles
-            # TRUE bundle = different products (e.g., Hantel + Scheiben)
-            # NOT bundle = quantity products (e.g., 2x Hantelscheibe)
-            # IMPORTANT: 1 bundle = 1 listing! Different listings must have different IDs
-            bundle_id = None
-            if ai_result.get("is_bundle"):
-                # Use listing_id to generate unique bundle_id per listing
-                # This ensures each bundle listing has its own unique ID
-                import hashlib
-                listing_id_str = str(listing.get("listing_id", ""))
-                bundle_hash = hashlib.md5(listing_id_str.encode()).hexdigest()[:8]
-                # Convert hex to integer (max 8 hex digits = 32-bit int)
-                bundle_id = int(bundle_hash, 16)
+                    # CRITICAL: Generate unique INTEGER bundle_id for TRUE bundles
+                    # TRUE bundle = different products (e.g., Hantel + Scheiben)
+                    # NOT bundle = quantity products (e.g., 2x Hantelscheibe)
+                    # IMPORTANT: 1 bundle = 1 listing! Different listings must have different IDs
+                    bundle_id = None
+                    if ai_result.get("is_bundle"):
+                        # Use listing_id to generate unique bundle_id per listing
+                        # This ensures each bundle listing has its own unique ID
+                        import hashlib
+                        listing_id_str = str(listing.get("listing_id", ""))
+                        bundle_hash = hashlib.md5(listing_id_str.encode()).hexdigest()[:8]
+                        # Convert hex to integer (max 8 hex digits = 32-bit int)
+                        bundle_id = int(bundle_hash, 16)
             
-            data = {
-                "platform": "ricardo",
-                "listing_id": listing["listing_id"],
-                "title": title,
-                "description": listing.get("description"),
-                "location": listing.get("location"),
-                "postal_code": listing.get("postal_code"),
-                "shipping": listing.get("shipping"),
-                "transport_car": ai_result.get("transport_car"),
-                "end_time": end_time,
-                "image_url": listing.get("image_url"),
-                "url": listing.get("url"),
-                "ai_notes": ai_result.get("ai_notes"),
-                "buy_now_price": buy_now,
-                "current_price_ricardo": current_price,
-                "bids_count": bids_count,
-                "new_price": ai_result.get("new_price"),
-                "resale_price_est": ai_result.get("resale_price_est"),
-                "expected_profit": ai_result.get("expected_profit"),
-                "deal_score": ai_result.get("deal_score"),
-                "variant_key": variant_key,
-                "predicted_final_price": ai_result.get("predicted_final_price"),
-                "prediction_confidence": ai_result.get("prediction_confidence"),
-                "is_bundle": ai_result.get("is_bundle", False),
-                "bundle_components": bundle_components_json,
-                "bundle_id": bundle_id,
-                "resale_price_bundle": ai_result.get("resale_price_bundle"),
-                "recommended_strategy": ai_result.get("recommended_strategy"),
-                "strategy_reason": ai_result.get("strategy_reason"),
-                "market_based_resale": ai_result.get("market_based_resale", False),
-                "market_sample_size": ai_result.get("market_sample_size"),
-                "market_value": ai_result.get("market_value"),
-                "price_source": price_source,
-                "shop_name": variant_info.get("shop_name") if variant_info else None,
-                "web_sources": variant_info.get("web_sources") if variant_info else None,
-                "buy_now_ceiling": ai_result.get("buy_now_ceiling"),
-                "hours_remaining": round(hours_remaining, 1) if hours_remaining is not None else None,
-                # v9: Metadata fields
-                "web_search_used": _check_web_search_used(variant_info, ai_result),
-                "cache_hit": variant_info.get("from_cache", False) if variant_info else False,
-                "vision_used": ai_result.get("vision_used", False),
-                "cleaned_title": listing.get("_cleaned_title"),
-                "run_id": run_id,
-                # v10: Additional metadata
-                "extraction_confidence": listing.get("_extraction_confidence", 0.0),
-                "bundle_type_v10": listing.get("_bundle_type").value if listing.get("_bundle_type") else None,
-                # FIX 6: Populate ai_cost_usd field
-                "ai_cost_usd": ai_result.get("ai_cost_usd", 0.0),
-                # PHASE 4.3: Persist canonical identity key for cross-run aggregation
-                "_identity_key": listing.get("_identity_key"),
-            }
+                    data = {
+                        "platform": "ricardo",
+                        "listing_id": listing["listing_id"],
+                        "title": title,
+                        "description": listing.get("description"),
+                        "location": listing.get("location"),
+                        "postal_code": listing.get("postal_code"),
+                        "shipping": listing.get("shipping"),
+                        "transport_car": ai_result.get("transport_car"),
+                        "end_time": end_time,
+                        "image_url": listing.get("image_url"),
+                        "url": listing.get("url"),
+                        "ai_notes": ai_result.get("ai_notes"),
+                        "buy_now_price": buy_now,
+                        "current_price_ricardo": current_price,
+                        "bids_count": bids_count,
+                        "new_price": ai_result.get("new_price"),
+                        "resale_price_est": ai_result.get("resale_price_est"),
+                        "expected_profit": ai_result.get("expected_profit"),
+                        "deal_score": ai_result.get("deal_score"),
+                        "variant_key": variant_key,
+                        "predicted_final_price": ai_result.get("predicted_final_price"),
+                        "prediction_confidence": ai_result.get("prediction_confidence"),
+                        "is_bundle": ai_result.get("is_bundle", False),
+                        "bundle_components": bundle_components_json,
+                        "bundle_id": bundle_id,
+                        "resale_price_bundle": ai_result.get("resale_price_bundle"),
+                        "recommended_strategy": ai_result.get("recommended_strategy"),
+                        "strategy_reason": ai_result.get("strategy_reason"),
+                        "market_based_resale": ai_result.get("market_based_resale", False),
+                        "market_sample_size": ai_result.get("market_sample_size"),
+                        "market_value": ai_result.get("market_value"),
+                        "price_source": price_source,
+                        "shop_name": variant_info.get("shop_name") if variant_info else None,
+                        "web_sources": variant_info.get("web_sources") if variant_info else None,
+                        "buy_now_ceiling": ai_result.get("buy_now_ceiling"),
+                        "hours_remaining": round(hours_remaining, 1) if hours_remaining is not None else None,
+                        # v9: Metadata fields
+                        "web_search_used": _check_web_search_used(variant_info, ai_result),
+                        "cache_hit": variant_info.get("from_cache", False) if variant_info else False,
+                        "vision_used": ai_result.get("vision_used", False),
+                        "cleaned_title": listing.get("_cleaned_title"),
+                        "run_id": run_id,
+                        # v10: Additional metadata
+                        "extraction_confidence": listing.get("_extraction_confidence", 0.0),
+                        "bundle_type_v10": listing.get("_bundle_type").value if listing.get("_bundle_type") else None,
+                        # FIX 6: Populate ai_cost_usd field
+                        "ai_cost_usd": ai_result.get("ai_cost_usd", 0.0),
+                        # PHASE 4.3: Persist canonical identity key for cross-run aggregation
+                        "_identity_key": listing.get("_identity_key"),
+                    }
             
-            # CRITICAL: Add detail data if available
-            detail_data = listing.get("_detail_data")
-            if detail_data:
-                # Normalize dict values to JSON strings to prevent DB warnings
-                desc = detail_data.get("full_description", "")
-                if isinstance(desc, dict):
-                    desc = json.dumps(desc, ensure_ascii=False)
-                data["description"] = desc
-                data["shipping"] = detail_data.get("shipping_cost")
-                data["pickup_available"] = detail_data.get("pickup_available")
-                data["seller_rating"] = detail_data.get("seller_rating")
-                data["location"] = detail_data.get("location")
+                    # CRITICAL: Add detail data if available
+                    detail_data = listing.get("_detail_data")
+                    if detail_data:
+                        # Normalize dict values to JSON strings to prevent DB warnings
+                        desc = detail_data.get("full_description", "")
+                        if isinstance(desc, dict):
+                            desc = json.dumps(desc, ensure_ascii=False)
+                        data["description"] = desc
+                        data["shipping"] = detail_data.get("shipping_cost")
+                        data["pickup_available"] = detail_data.get("pickup_available")
+                        data["seller_rating"] = detail_data.get("seller_rating")
+                        data["location"] = detail_data.get("location")
             
-            # Track metrics for analysis
-            if not hasattr(save_evaluation, 'run_metrics'):
-                save_evaluation.run_metrics = {
-                    'total': 0,
-                    'bundles': 0,
-                    'price_sources': {},
-                    'strategies': {},
-                    'errors': [],
-                    'websearch_hits': 0,
-                    'websearch_misses': 0,
-                }
+                    # Track metrics for analysis
+                    if not hasattr(save_evaluation, 'run_metrics'):
+                        save_evaluation.run_metrics = {
+                            'total': 0,
+                            'bundles': 0,
+                            'price_sources': {},
+                            'strategies': {},
+                            'errors': [],
+                            'websearch_hits': 0,
+                            'websearch_misses': 0,
+                        }
             
-            save_evaluation.run_metrics['total'] += 1
-            if is_bundle:
-                save_evaluation.run_metrics['bundles'] += 1
-                global_stats['bundles_created'] += 1
+                    save_evaluation.run_metrics['total'] += 1
+                    if is_bundle:
+                        save_evaluation.run_metrics['bundles'] += 1
+                        global_stats['bundles_created'] += 1
             
-            # Track deals and profitable deals for run statistics
-            global_stats['deals_created'] += 1
-            if profit and profit >= 20:  # Same as MIN_PROFIT_THRESHOLD
-                global_stats['profitable_deals'] += 1
+                    # Track deals and profitable deals for run statistics
+                    global_stats['deals_created'] += 1
+                    if profit and profit >= 20:  # Same as MIN_PROFIT_THRESHOLD
+                        global_stats['profitable_deals'] += 1
             
-            # Track price sources
-            ps = data.get('price_source', 'unknown')
-            save_evaluation.run_metrics['price_sources'][ps] = save_evaluation.run_metrics['price_sources'].get(ps, 0) + 1
+                    # Track price sources
+                    ps = data.get('price_source', 'unknown')
+                    save_evaluation.run_metrics['price_sources'][ps] = save_evaluation.run_metrics['price_sources'].get(ps, 0) + 1
             
-            # Track strategies
-            strat = data.get('recommended_strategy', 'unknown')
-            save_evaluation.run_metrics['strategies'][strat] = save_evaluation.run_metrics['strategies'].get(strat, 0) + 1
+                    # Track strategies
+                    strat = data.get('recommended_strategy', 'unknown')
+                    save_evaluation.run_metrics['strategies'][strat] = save_evaluation.run_metrics['strategies'].get(strat, 0) + 1
             
-            # Track websearch success
-            if data.get('web_search_used'):
-                if data.get('shop_name'):
-                    save_evaluation.run_metrics['websearch_hits'] += 1
-                else:
-                    save_evaluation.run_metrics['websearch_misses'] += 1
+                    # Track websearch success
+                    if data.get('web_search_used'):
+                        if data.get('shop_name'):
+                            save_evaluation.run_metrics['websearch_hits'] += 1
+                        else:
+                            save_evaluation.run_metrics['websearch_misses'] += 1
             
-            # v2.2: Use save_evaluation bridge function
-            save_evaluation(conn, data)
+                    # v2.2: Persisted via save_evaluations_bulk() in chunks, rest flushed below
+                    pending_saves.append(data)
+                    if len(pending_saves) >= _SAVE_CHUNK_SIZE:
+                        batch, pending_saves = pending_saves, []
+                        save_evaluations_bulk(conn, batch)
             
-            # Collect for detail scraping
-            if profit and profit > 0 and listing.get("url"):
-                deals_this_query.append({
-                    "listing_id": listing["listing_id"],
-                    "title": title,
-                    "url": listing["url"],
-                    "expected_profit": profit,
-                    "deal_score": ai_result.get("deal_score"),
-                    "recommended_strategy": strategy,  # Fix: include strategy for proper counting
-                })
-        
-        all_deals_for_detail.extend(deals_this_query)
+                    # Collect for detail scraping
+                    if profit and profit > 0 and listing.get("url"):
+                        deals_this_query.append({
+                            "listing_id": listing["listing_id"],
+                            "title": title,
+                            "url": listing["url"],
+                            "expected_profit": profit,
+                            "deal_score": ai_result.get("deal_score"),
+                            "recommended_strategy": strategy,  # Fix: include strategy for proper counting
+                        })
+            finally:
+                # Persist what was evaluated even if a later listing raised
+                save_evaluations_bulk(conn, pending_saves)
+            all_deals_for_detail.extend(deals_this_query)
+    finally:
+        if eval_pool:
+            eval_pool.shutdown(cancel_futures=True)
     
     # Count strategies
     strategies = {}
@@ -1350,20 +1493,58 @@ def run_v10_pipeline(
 # ==============================================================================
 
 class TeeOutput:
-    """Captures stdout to both console and string buffer."""
-    def __init__(self):
+    """Captures stdout to both console and a log file spooled next to the final log."""
+    def __init__(self, log_dir: str = "."):
         self.terminal = sys.stdout
-        self.log = StringIO()
+        # Temp file in the target directory so save_log() can move it into place without copying
+        self.log = tempfile.NamedTemporaryFile(
+            mode='w', encoding='utf-8', newline='', buffering=1 << 20,
+            dir=log_dir, prefix='.run_log_', suffix='.tmp', delete=False,
+        )
+        self._buf = []  # pending log fragments, joined into self.log in batches
+        self._lock = threading.Lock()  # Phase 4 AI workers print concurrently
+        self._local = threading.local()  # per-thread capture buffer, see capture()
+    
+    @contextmanager
+    def capture(self):
+        """Collect this thread's writes into a list instead of emitting them."""
+        self._local.captured = captured = []
+        try:
+            yield captured
+        finally:
+            self._local.captured = None
     
     def write(self, message):
-        self.terminal.write(message)
-        self.log.write(message)
+        captured = getattr(self._local, "captured", None)
+        if captured is not None:
+            captured.append(message)
+            return
+        with self._lock:
+            self.terminal.write(message)
+            self._buf.append(message)
+            if len(self._buf) > 64:
+                self._flush_log()
+    
+    def _flush_log(self):
+        self.log.write(''.join(self._buf))
+        self._buf.clear()
     
     def flush(self):
         self.terminal.flush()
     
-    def get_log(self):
-        return self.log.getvalue()
+    def save_log(self, filename: str = "last_run.log"):
+        """Move the captured log to filename. Call after stdout has been restored."""
+        try:
+            self._flush_log()
+            self.log.close()
+            os.replace(self.log.name, filename)
+            print(f"\n📝 Log saved to: {filename}")
+        except Exception as e:
+            print(f"\n⚠️ Failed to save log: {e}")
+            try:
+                os.remove(self.log.name)
+            except OSError:
+                pass
 
 
 def log_section(title: str):
@@ -1376,79 +1557,118 @@ def log_debug(label: str, data: Any):
     print(f"[DEBUG] {label}: {data}")
 
 
-def save_log_to_file(log_content: str, filename: str = "last_run.log"):
-    """Save captured log to file."""
-    try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(log_content)
-        print(f"\n📝 Log saved to: {filename}")
-    except Exception as e:
-        print(f"\n⚠️ Failed to save log: {e}")
+def _json_dumps_indented(obj: Any) -> str:
+    """json.dumps(obj, indent=2, ensure_ascii=False), encoded with orjson if installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _json_dumps_indented_bytes(obj: Any) -> bytes:
+    """Same output as _json_dumps_indented() as UTF-8 bytes, without the str round trip under orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Export files are written row by row; a 1 MiB buffer keeps that to few syscalls
+_EXPORT_WRITE_BUFFER = 1 << 20
+
+def _open_export_file(path: str, compress: bool, newline: str = None, binary: bool = False):
+    """Open an export file for text (or binary) writing; gzip level 1 if compress is set."""
+    if binary:
+        if compress:
+            return gzip.open(path, 'wb', compresslevel=1)
+        return open(path, 'wb', buffering=_EXPORT_WRITE_BUFFER)
+    if compress:
+        return gzip.open(path, 'wt', compresslevel=1, encoding='utf-8', newline=newline)
+    return open(path, 'w', encoding='utf-8', newline=newline, buffering=_EXPORT_WRITE_BUFFER)
+
+
+# Per-column value conversion for JSON/CSV export, keyed by PostgreSQL type OID
+_EXPORT_CONVERTERS = {
+    1082: lambda v: v.isoformat(),  # date
+    1083: lambda v: v.isoformat(),  # time
+    1114: lambda v: v.isoformat(),  # timestamp
+    1184: lambda v: v.isoformat(),  # timestamptz
+    1700: float,                    # numeric (Decimal)
+}
 
 
-def export_listings_to_file(conn, filename: str = "last_run_listings.json", run_id: str = None):
-    """Export listings from database to JSON file. If run_id provided, only export that run."""
+def export_listings_to_file(conn, filename: str = "last_run_listings.json", run_id: str = None, export_time: str = None,
+                            compress: bool = False):
+    """
+    Export listings from database to JSON file. If run_id provided, only export that run.
+    With compress=True the JSON and CSV files are written gzip-compressed (<name>.gz).
+    """
+    export_time = export_time or datetime.now().isoformat()
     try:
-        cur = conn.cursor()
-        if run_id:
-            cur.execute("""
-                SELECT 
-                    id, run_id, platform, source_id, url, title, image_url, product_id,
-                    buy_now_price, current_bid, bids_count, end_time, location,
-                    shipping_cost, pickup_available, seller_rating, first_seen, last_seen
-                FROM listings
-                WHERE run_id = %s
-                ORDER BY id DESC
-            """, (run_id,))
-        else:
-            cur.execute("""
-                SELECT 
-                    id, run_id, platform, source_id, url, title, image_url, product_id,
-                    buy_now_price, current_bid, bids_count, end_time, location,
-                    shipping_cost, pickup_available, seller_rating, first_seen, last_seen
-                FROM listings
-                ORDER BY id DESC
-            """)
-        
-        columns = [desc[0] for desc in cur.description]
-        rows = cur.fetchall()
-        
-        # Convert to list of dicts
-        listings = []
-        for row in rows:
-            listing = {}
-            for i, col in enumerate(columns):
-                value = row[i]
-                # Convert datetime to string
-                if hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-                # Convert Decimal to float
-                elif hasattr(value, '__float__'):
-                    value = float(value)
-                listing[col] = value
-            listings.append(listing)
-        
-        # Save to JSON
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                'export_time': datetime.now().isoformat(),
-                'total_listings': len(listings),
-                'listings': listings
-            }, f, indent=2, ensure_ascii=False)
+        # Server-side cursor: rows are streamed in batches of itersize instead of
+        # being fetched into one list. WITH HOLD because the connection is autocommit.
+        with conn.cursor(name="export_listings", withhold=True) as cur:
+            cur.itersize = 1000
+            if run_id:
+                cur.execute("""
+                    SELECT 
+                        id, run_id, platform, source_id, url, title, image_url, product_id,
+                        buy_now_price, current_bid, bids_count, end_time, location,
+                        shipping_cost, pickup_available, seller_rating, first_seen, last_seen
+                    FROM listings
+                    WHERE run_id = %s
+                    ORDER BY id DESC
+                """, (run_id,))
+            else:
+                cur.execute("""
+                    SELECT 
+                        id, run_id, platform, source_id, url, title, image_url, product_id,
+                        buy_now_price, current_bid, bids_count, end_time, location,
+                        shipping_cost, pickup_available, seller_rating, first_seen, last_seen
+                    FROM listings
+                    ORDER BY id DESC
+                """)
         
-        print(f"📊 Exported {len(listings)} listings to: {filename}")
+            # Named cursors only know their columns after the first fetch
+            rows = iter(cur)
+            first_row = next(rows, None)
+            columns = [desc[0] for desc in cur.description]
+            converters = [_EXPORT_CONVERTERS.get(desc.type_code) for desc in cur.description]
         
-        # Also export as CSV for easy analysis
-        csv_filename = filename.replace('.json', '.csv')
-        with open(csv_filename, 'w', encoding='utf-8', newline='') as f:
+            # Stream JSON + CSV in one pass and accumulate the analysis counters alongside
+            csv_filename = filename.replace('.json', '.csv')
+            if compress:
+                filename += '.gz'
+                csv_filename += '.gz'
+            analysis = _AnalysisAccumulator()
+            count = 0
             import csv
-            writer = csv.DictWriter(f, fieldnames=columns, delimiter=';')
-            writer.writeheader()
-            writer.writerows(listings)
-        print(f"📊 Exported {len(listings)} listings to: {csv_filename}")
+            # JSON side is written as bytes: orjson output goes to the file without decode/re-encode
+            with _open_export_file(filename, compress, binary=True) as f, \
+                    _open_export_file(csv_filename, compress, newline='') as csv_f:
+                writer = csv.writer(csv_f, delimiter=';')
+                writer.writerow(columns)
+            
+                f.write(b'{\n  "export_time": %s,\n  "listings": [' % json.dumps(export_time).encode('utf-8'))
+                if first_row is not None:
+                    for row in itertools.chain((first_row,), rows):
+                        values = [
+                            conv(value) if conv is not None and value is not None else value
+                            for conv, value in zip(converters, row)
+                        ]
+                        listing = dict(zip(columns, values))
+                    
+                        f.write(b',\n    ' if count else b'\n    ')
+                        f.write(_json_dumps_indented_bytes(listing).replace(b'\n', b'\n    '))
+                        writer.writerow(values)
+                        analysis.add(listing)
+                        count += 1
+                    f.write(b'\n  ')
+                f.write(b'],\n  "total_listings": %d\n}' % count)
+        
+        print(f"📊 Exported {count} listings to: {filename}")
+        print(f"📊 Exported {count} listings to: {csv_filename}")
         
         # Also create analysis export with quality metrics
-        export_analysis_data(listings, "analysis_data.json")
+        _write_analysis_data(analysis, "analysis_data.json", export_time=export_time)
         
         # Print comprehensive run summary for analysis
         print("\n" + "="*80)
@@ -1492,74 +1712,101 @@ def export_listings_to_file(conn, filename: str = "last_run_listings.json", run_
         print("\n" + "="*80)
         
     except Exception as e:
-        print(f"⚠️ Failed to export listings: {e}")
-        traceback.print_exc()
+        print(f"⚠️ Failed to export listings: {type(e).__name__}: {e}")
 
 
-def export_analysis_data(listings: list, filename: str = "analysis_data.json"):
-    """
-    Export comprehensive analysis data for automatic quality assessment.
-    This file contains all data needed for Cascade to analyze run quality.
-    """
-    from ai_filter import RUN_COST_USD, WEB_SEARCH_COUNT_TODAY
-    from ai_filter_cache_helpers import _web_price_cache, _variant_cache
-    
-    # Calculate quality metrics
-    total = len(listings)
-    if total == 0:
-        return
-    
-    # Price source breakdown
-    price_sources = {}
-    for l in listings:
-        src = l.get('price_source', 'unknown')
-        price_sources[src] = price_sources.get(src, 0) + 1
+# Weight-plate price check in export_analysis_data()
+_WEIGHT_TITLE_KEYWORDS = ('hantelscheiben', 'hantelscheibe', 'gewicht', 'kg')
+_KG_RE = re.compile(r'(\d+)\s*kg')
+
+class _AnalysisAccumulator:
+    """Running counters for export_analysis_data(), fed one listing at a time."""
     
-    # Strategy breakdown
-    strategies = {}
-    for l in listings:
-        strat = l.get('recommended_strategy', 'unknown')
-        strategies[strat] = strategies.get(strat, 0) + 1
-    
-    # Profit analysis
-    profits = [l.get('expected_profit', 0) or 0 for l in listings]
-    profitable = [p for p in profits if p > 20]
-    
-    # Bundle analysis
-    bundles = [l for l in listings if l.get('is_bundle')]
-    bundle_issues = []
-    for b in bundles:
-        comps = b.get('bundle_components', [])
-        if isinstance(comps, list):
-            for c in comps:
-                if isinstance(c, dict) and c.get('new_price_each') == 50.0:
-                    bundle_issues.append({
-                        'title': b.get('title', ''),
-                        'component': c.get('name', ''),
-                        'issue': 'Default 50 CHF price used'
-                    })
-    
-    # Suspicious prices (likely wrong)
-    suspicious = []
-    for l in listings:
+    def __init__(self):
+        self.total = 0
+        self.price_sources = Counter()
+        self.strategies = Counter()
+        self.profit_max = None
+        self.profit_min = None
+        self.profit_sum = 0
+        self.profitable_count = 0
+        self.bundles_count = 0
+        self.web_search_listings = 0
+        self.bundle_issues = []
+        self.suspicious = []
+    
+    def add(self, l: Dict[str, Any]):
+        self.total += 1
+        self.price_sources[l.get('price_source', 'unknown')] += 1
+        self.strategies[l.get('recommended_strategy', 'unknown')] += 1
+        
+        # Profit analysis
+        profit = l.get('expected_profit', 0) or 0
+        self.profit_sum += profit
+        if self.profit_max is None or profit > self.profit_max:
+            self.profit_max = profit
+        if self.profit_min is None or profit < self.profit_min:
+            self.profit_min = profit
+        if profit > 20:
+            self.profitable_count += 1
+        
+        if l.get('web_search_used'):
+            self.web_search_listings += 1
+        
+        # Bundle analysis
+        if l.get('is_bundle'):
+            self.bundles_count += 1
+            comps = l.get('bundle_components', [])
+            if isinstance(comps, list):
+                for c in comps:
+                    if isinstance(c, dict) and c.get('new_price_each') == 50.0:
+                        self.bundle_issues.append({
+                            'title': l.get('title', ''),
+                            'component': c.get('name', ''),
+                            'issue': 'Default 50 CHF price used'
+                        })
+        
+        # Suspicious prices (likely wrong)
         new_p = l.get('new_price', 0) or 0
-        resale = l.get('resale_price_est', 0) or 0
         title = l.get('title', '')
+        title_lower = title.lower()
         
         # Check for old electronics with too high new_price
-        if 'fenix 5' in title.lower() and new_p > 400:
-            suspicious.append({'title': title, 'issue': f'Fenix 5 new_price {new_p} CHF too high (model from 2017)'})
-        if 'fenix 6' in title.lower() and new_p > 600:
-            suspicious.append({'title': title, 'issue': f'Fenix 6 new_price {new_p} CHF too high (model from 2019)'})
+        if 'fenix 5' in title_lower and new_p > 400:
+            self.suspicious.append({'title': title, 'issue': f'Fenix 5 new_price {new_p} CHF too high (model from 2017)'})
+        if 'fenix 6' in title_lower and new_p > 600:
+            self.suspicious.append({'title': title, 'issue': f'Fenix 6 new_price {new_p} CHF too high (model from 2019)'})
         
         # Check for weight equipment with wrong prices
-        if any(kw in title.lower() for kw in ['hantelscheiben', 'hantelscheibe', 'gewicht', 'kg']):
-            import re
-            kg_match = re.search(r'(\d+)\s*kg', title.lower())
+        if any(kw in title_lower for kw in _WEIGHT_TITLE_KEYWORDS):
+            kg_match = _KG_RE.search(title_lower)
             if kg_match:
                 kg = float(kg_match.group(1))
                 if new_p > 0 and new_p / kg > 10:  # More than 10 CHF/kg is suspicious
-                    suspicious.append({'title': title, 'issue': f'{new_p/kg:.1f} CHF/kg is too high for weight plates'})
+                    self.suspicious.append({'title': title, 'issue': f'{new_p/kg:.1f} CHF/kg is too high for weight plates'})
+
+
+def export_analysis_data(listings: list, filename: str = "analysis_data.json", export_time: str = None):
+    """
+    Export comprehensive analysis data for automatic quality assessment.
+    This file contains all data needed for Cascade to analyze run quality.
+    """
+    acc = _AnalysisAccumulator()
+    for l in listings:
+        acc.add(l)
+    _write_analysis_data(acc, filename, export_time=export_time)
+
+
+def _write_analysis_data(acc: _AnalysisAccumulator, filename: str, export_time: str = None):
+    """Compute the quality score from accumulated counters and write the analysis file."""
+    # Calculate quality metrics
+    total = acc.total
+    if total == 0:
+        return
+    
+    price_sources = dict(acc.price_sources)
+    bundle_issues = acc.bundle_issues
+    suspicious = acc.suspicious
     
     # v7.3.3: Improved quality score calculation
     # Count web sources (good data quality)
@@ -1579,7 +1826,7 @@ def export_analysis_data(listings: list, filename: str = "analysis_data.json"):
     quality_score += min(market_count * 3, 15)
     
     # POSITIVE: Profitable deals found (+1 each, max +15)
-    quality_score += min(len(profitable) * 3, 15)
+    quality_score += min(acc.profitable_count * 3, 15)
     
     # NEGATIVE: Bundle default prices (-3 each)
     quality_score -= len(bundle_issues) * 3
@@ -1593,23 +1840,23 @@ def export_analysis_data(listings: list, filename: str = "analysis_data.json"):
     quality_score = max(0, min(100, quality_score))
     
     analysis = {
-        'export_time': datetime.now().isoformat(),
+        'export_time': export_time or datetime.now().isoformat(),
         'quality_score': round(quality_score, 1),
         'summary': {
             'total_listings': total,
-            'profitable_deals': len(profitable),
-            'bundles_detected': len(bundles),
-            'web_searches_used': len([l for l in listings if l.get('web_search_used')]),  # FIX 4: Count listings, not API calls
-            'web_search_api_calls': WEB_SEARCH_COUNT_TODAY,  # FIX 4: Track API calls separately
-            'run_cost_usd': round(RUN_COST_USD, 4),
+            'profitable_deals': acc.profitable_count,
+            'bundles_detected': acc.bundles_count,
+            'web_searches_used': acc.web_search_listings,  # FIX 4: Count listings, not API calls
+            'web_search_api_calls': _ai_filter.WEB_SEARCH_COUNT_TODAY,  # FIX 4: Track API calls separately
+            'run_cost_usd': round(_ai_filter.RUN_COST_USD, 4),
         },
         'price_sources': price_sources,
-        'strategies': strategies,
+        'strategies': dict(acc.strategies),
         'profit_stats': {
-            'max': max(profits) if profits else 0,
-            'min': min(profits) if profits else 0,
-            'avg': sum(profits) / len(profits) if profits else 0,
-            'profitable_count': len(profitable),
+            'max': acc.profit_max,
+            'min': acc.profit_min,
+            'avg': acc.profit_sum / total,
+            'profitable_count': acc.profitable_count,
         },
         'issues': {
             'bundle_default_prices': bundle_issues,
@@ -1628,7 +1875,7 @@ def export_analysis_data(listings: list, filename: str = "analysis_data.json"):
         analysis['recommendations'].append('High AI fallback rate - web search may be failing')
     
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(analysis, f, indent=2, ensure_ascii=False)
+        f.write(_json_dumps_indented(analysis))
     
     print(f"📊 Analysis data exported to: {filename} (Quality: {quality_score:.0f}/100)")
 
@@ -1638,10 +1885,21 @@ def export_analysis_data(listings: list, filename: str = "analysis_data.json"):
 # ==============================================================================
 
 def run_once():
-    # Start capturing output
+    # Start capturing output; the log is saved on every exit path (sys.exit and early returns included)
     tee = TeeOutput()
     original_stdout = sys.stdout
     sys.stdout = tee
+    try:
+        _run_once_captured()
+    finally:
+        # Restore stdout and save log
+        sys.stdout = original_stdout
+        tee.save_log("last_run.log")
+
+
+def _run_once_captured():
+    # One timestamp for all exports of this run
+    run_started_iso = datetime.now().isoformat()
     
     log_section("Starting DealFinder Pipeline v7.2 (Improved Accessory Filter)")
 
@@ -1677,6 +1935,7 @@ def run_once():
     # v7.0: Detail scraping settings
     detail_pages_enabled = getattr(cfg.general, "detail_pages_enabled", False)
     max_detail_pages = getattr(cfg.general, "max_detail_pages_per_run", 5)
+    compress_exports = getattr(cfg.general, "compress_exports", False)
     
     # v9.0: Clarity detection settings
     clarity_detection_enabled = getattr(cfg.general, "clarity_detection_enabled", True)
@@ -1843,6 +2102,7 @@ def run_once():
         "skipped_ai_accessory": 0,
         "skipped_defect": 0,
         "skipped_exclude": 0,
+        "skipped_duplicate": 0,
         "sent_to_ai": 0,
         "bundles_created": 0,
         "deals_created": 0,
@@ -2024,13 +2284,15 @@ def run_once():
             print(f"🤖 AI accessory filter:        {global_stats['skipped_ai_accessory']}")
             print(f"🔧 Defect filter:              {global_stats['skipped_defect']}")
             print(f"⚪ Exclude terms filter:       {global_stats['skipped_exclude']}")
+            print(f"♻️ Duplicate listings:         {global_stats['skipped_duplicate']}")
             print(f"🧠 Sent to AI evaluation:      {global_stats['sent_to_ai']}")
             
             total_filtered = (
                 global_stats['skipped_hardcoded_accessory'] + 
                 global_stats['skipped_ai_accessory'] + 
                 global_stats['skipped_defect'] + 
-                global_stats['skipped_exclude']
+                global_stats['skipped_exclude'] +
+                global_stats['skipped_duplicate']
             )
             
             if global_stats['total_scraped'] > 0:
@@ -2049,11 +2311,9 @@ def run_once():
             cost_info = logger.get_cost_summary()
             
             # Calculate approximate cost breakdown
-            from ai_filter import RUN_COST_USD, WEB_SEARCH_COUNT_TODAY
-            
             log_cost_summary(
                 ai_calls=len(cost_info["ai_steps"]) + len(cost_info["cost_steps"]),
-                web_searches=WEB_SEARCH_COUNT_TODAY,
+                web_searches=_ai_filter.WEB_SEARCH_COUNT_TODAY,
                 total_cost_usd=run_cost,
                 breakdown={
                     "Query Analysis": 0.002,  # Haiku
@@ -2089,7 +2349,8 @@ def run_once():
             export_run_stats(conn, "last_run_stats.json")
             
             # Legacy export (for backwards compatibility) - now filtered by run_id
-            export_listings_to_file(conn, "last_run_listings.json", run_id=run_id)
+            export_listings_to_file(conn, "last_run_listings.json", run_id=run_id, export_time=run_started_iso,
+                                    compress=compress_exports)
             
             # IMPROVEMENT #4: Post-run invariant checks (TEST MODE ONLY)
             try:
@@ -2132,11 +2393,6 @@ def run_once():
     
     finally:
         cleanup_profile(tmp_profile)
-        
-        # Restore stdout and save log
-        sys.stdout = original_stdout
-        log_content = tee.get_log()
-        save_log_to_file(log_content, "last_run.log")
 
 
 # ==============================================================================
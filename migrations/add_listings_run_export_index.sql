@@ -0,0 +1,12 @@
+-- Migration: Add (run_id, id) index to listings
+-- Purpose: Let the per-run listings export stream from an index scan
+-- Date: 2026-10-18
+-- Context: export_listings_to_file() runs
+--            SELECT ... FROM listings WHERE run_id = $1 ORDER BY id DESC
+--          through a server-side cursor. With only idx_listings_run the
+--          matching rows have to be sorted before the first row is returned.
+
+CREATE INDEX IF NOT EXISTS idx_listings_run_id_id ON listings(run_id, id);
+
+-- Performance note: Postgres scans this index backwards for ORDER BY id DESC,
+-- so the export needs no sort step.
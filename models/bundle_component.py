@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class BundleComponent:
     """
     Single component of a bundle listing.
@@ -91,7 +91,7 @@ class BundleComponent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BundleExtractionResult:
     """
     Result of bundle component extraction.
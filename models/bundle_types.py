@@ -76,6 +76,16 @@ class PricingMethod(Enum):
     # Cannot be priced
 
 
+_PRICING_METHOD_BY_BUNDLE_TYPE = {
+    BundleType.SINGLE_PRODUCT: PricingMethod.SINGLE_PRICE,
+    BundleType.QUANTITY: PricingMethod.QUANTITY_MULTIPLY,
+    BundleType.MULTI_PRODUCT: PricingMethod.SUM_OF_PARTS,
+    BundleType.WEIGHT_BASED: PricingMethod.WEIGHT_BASED_ESTIMATE,
+    BundleType.BULK_LOT: PricingMethod.BULK_ESTIMATE,
+    BundleType.UNKNOWN: PricingMethod.UNKNOWN,
+}
+
+
 def get_pricing_method(bundle_type: BundleType) -> PricingMethod:
     """
     Determines pricing method based on bundle type.
@@ -86,13 +96,4 @@ def get_pricing_method(bundle_type: BundleType) -> PricingMethod:
     Returns:
         Appropriate pricing method
     """
-    mapping = {
-        BundleType.SINGLE_PRODUCT: PricingMethod.SINGLE_PRICE,
-        BundleType.QUANTITY: PricingMethod.QUANTITY_MULTIPLY,
-        BundleType.MULTI_PRODUCT: PricingMethod.SUM_OF_PARTS,
-        BundleType.WEIGHT_BASED: PricingMethod.WEIGHT_BASED_ESTIMATE,
-        BundleType.BULK_LOT: PricingMethod.BULK_ESTIMATE,
-        BundleType.UNKNOWN: PricingMethod.UNKNOWN,
-    }
-    
-    return mapping.get(bundle_type, PricingMethod.UNKNOWN)
+    return _PRICING_METHOD_BY_BUNDLE_TYPE.get(bundle_type, PricingMethod.UNKNOWN)
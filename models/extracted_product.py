@@ -7,12 +7,12 @@ CRITICAL: Can be empty (products=[]) if too unclear!
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from models.product_spec import ProductSpec
 from models.bundle_types import BundleType
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedProduct:
     """
     Result of product extraction from a listing.
@@ -49,6 +49,7 @@ class ExtractedProduct:
     # === METADATA ===
     extraction_method: str = "ai_structured"  # "ai_structured", "ai_with_detail", "ai_with_vision"
     ai_cost_usd: float = 0.0
+    detail_data: Optional[Dict[str, Any]] = None  # Seller/shipping data when extracted with detail page
     
     def to_dict(self):
         """Convert to dictionary for serialization."""
@@ -8,12 +8,59 @@ CRITICAL: No domain assumptions. Specs included because EXPLICITLY mentioned,
 """
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from models.product_spec import ProductSpec
 
 
-@dataclass
+# Spec value parsing (_canonicalize_spec_value)
+_STORAGE_RE = re.compile(r'(\d+)\s*([gGtTmM][bB])?')
+_VOLT_RE = re.compile(r'(\d+)\s*([vV])?')
+_WEIGHT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([kK][gG])?')
+_SCREEN_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(inch|zoll)?', re.IGNORECASE)
+
+# Spec key -> (value pattern, canonical unit suffix)
+_UNIT_SPEC_FORMATS = {
+    "storage_gb": (_STORAGE_RE, "GB"),             # Storage: UPPERCASE (GB)
+    "voltage": (_VOLT_RE, "V"),                    # Voltage: UPPERCASE (V)
+    "weight_kg": (_WEIGHT_RE, "kg"),               # Weight: lowercase (kg)
+    "screen_size_inch": (_SCREEN_RE, "_inch"),     # Screen size: lowercase with separator
+}
+
+# Clothing sizes (_is_clothing_size) - not price-relevant, excluded from keys
+_SIZE_KEYS = frozenset(("size", "size_clothing", "groesse", "taille"))
+_CLOTHING_SIZES = frozenset((
+    # Letter sizes
+    "XS", "S", "M", "L", "XL", "XXL", "XXXL",
+    # Numeric sizes (European)
+    "32", "34", "36", "38", "40", "42", "44", "46", "48", "50", "52", "54",
+    "56", "58", "60", "62", "64", "66", "68",
+    # Suit sizes
+    "90", "94", "98", "102", "106", "110",
+))
+
+# Generation expressions (normalize_generation)
+_GEN_ORDINAL_RE = re.compile(r'\(?([0-9]+)(?:st|nd|rd|th)\s+gen(?:eration)?\)?')
+_GEN_DOT_RE = re.compile(r'\(?([0-9]+)\.\s+generation\)?')
+_GEN_WORD_NUMBERS = {"first": "1", "second": "2", "third": "3", "fourth": "4", "fifth": "5"}
+_GEN_WORD_RE = re.compile(r'\b(first|second|third|fourth|fifth)\s+gen(?:eration)?\b')
+
+# Color and condition terms stripped from the canonical key in one pass (not market-defining)
+_STRIP_TERMS_RE = re.compile(
+    r'\b(?:schwarz|weiss|rot|blau|grün|gelb|grau|black|white|red|blue|green|yellow|gray|grey'
+    r'|silber|silver|gold|rosa|pink'
+    r'|neu|new|gebraucht|used|wie_neu|ovp)\b',
+    re.IGNORECASE,
+)
+# Marketing noise, removed as plain substrings in this order
+_NOISE_TERMS = ("top", "super", "mega", "original", "!!!")
+# Runs of spaces, hyphens and underscores become one underscore in the canonical key
+_SEPARATOR_RUN_RE = re.compile(r'[ \-_]+')
+
+
+@dataclass(slots=True)
 class ProductIdentity:
     """
     Two-Level Identity Model for Product Deduplication and Market Aggregation.
@@ -100,25 +147,12 @@ class ProductIdentity:
         Returns:
             True if this is a clothing size that should be excluded
         """
-        value_str = str(value).strip().upper()
-        
-        # Common clothing size patterns
-        clothing_sizes = {
-            # Letter sizes
-            "XS", "S", "M", "L", "XL", "XXL", "XXXL",
-            # Numeric sizes (European)
-            "32", "34", "36", "38", "40", "42", "44", "46", "48", "50", "52", "54",
-            "56", "58", "60", "62", "64", "66", "68",
-            # Suit sizes
-            "90", "94", "98", "102", "106", "110",
-        }
-        
         # Check if key explicitly indicates size
-        if key in ["size", "size_clothing", "groesse", "taille"]:
+        if key in _SIZE_KEYS:
             return True
         
         # Check if value matches clothing size pattern
-        if value_str in clothing_sizes:
+        if str(value).strip().upper() in _CLOTHING_SIZES:
             return True
         
         return False
@@ -140,18 +174,13 @@ class ProductIdentity:
         text_lower = text.lower()
         
         # Pattern 1: "(2nd generation)" or "2nd gen" -> "gen_2"
-        text_lower = re.sub(r'\(?([0-9]+)(?:st|nd|rd|th)\s+gen(?:eration)?\)?', r'gen_\1', text_lower)
+        text_lower = _GEN_ORDINAL_RE.sub(r'gen_\1', text_lower)
         
         # Pattern 2: "(2. Generation)" -> "gen_2"
-        text_lower = re.sub(r'\(?([0-9]+)\.\s+generation\)?', r'gen_\1', text_lower)
+        text_lower = _GEN_DOT_RE.sub(r'gen_\1', text_lower)
         
         # Pattern 3: "second generation" -> "gen_2"
-        gen_words = {
-            "first": "1", "second": "2", "third": "3", 
-            "fourth": "4", "fifth": "5"
-        }
-        for word, num in gen_words.items():
-            text_lower = re.sub(r'\b' + word + r'\s+gen(?:eration)?\b', f'gen_{num}', text_lower)
+        text_lower = _GEN_WORD_RE.sub(lambda m: f'gen_{_GEN_WORD_NUMBERS[m.group(1)]}', text_lower)
         
         return text_lower
     
@@ -174,42 +203,15 @@ class ProductIdentity:
         """
         value_str = str(value)
         
-        # Storage: UPPERCASE (GB, TB, MB)
-        if key == "storage_gb":
-            # Extract number and ensure GB is uppercase
-            match = re.match(r'(\d+)\s*([gGtTmM][bB])?', value_str)
-            if match:
-                num = match.group(1)
-                return f"{num}GB"
-            return f"{value_str}GB"
-        
-        # Voltage: UPPERCASE (V)
-        elif key == "voltage":
-            match = re.match(r'(\d+)\s*([vV])?', value_str)
-            if match:
-                num = match.group(1)
-                return f"{num}V"
-            return f"{value_str}V"
-        
-        # Weight: lowercase (kg, g)
-        elif key == "weight_kg":
-            match = re.match(r'(\d+(?:\.\d+)?)\s*([kK][gG])?', value_str)
-            if match:
-                num = match.group(1)
-                return f"{num}kg"
-            return f"{value_str}kg"
-        
-        # Screen size: lowercase with space
-        elif key == "screen_size_inch":
-            match = re.match(r'(\d+(?:\.\d+)?)\s*(inch|zoll)?', value_str, re.IGNORECASE)
-            if match:
-                num = match.group(1)
-                return f"{num}_inch"
-            return f"{value_str}_inch"
-        
-        # Generic: lowercase, replace spaces with underscores
-        else:
+        unit_format = _UNIT_SPEC_FORMATS.get(key)
+        if unit_format is None:
+            # Generic: lowercase, replace spaces with underscores
             return value_str.lower().replace(" ", "_")
+        
+        # Unit specs: leading number + canonical unit (whole value if no number)
+        pattern, unit = unit_format
+        match = pattern.match(value_str)
+        return f"{match.group(1) if match else value_str}{unit}"
     
     @staticmethod
     def from_product_spec(spec: ProductSpec) -> 'ProductIdentity':
@@ -219,59 +221,22 @@ class ProductIdentity:
         RULE: Specs included because explicitly mentioned,
               NOT because of product category or domain knowledge.
         """
-        parts = []
-        specs_norm = {}
-        
-        # Brand (if present)
-        if spec.brand:
-            brand_norm = spec.brand.lower().replace(" ", "_")
-            parts.append(brand_norm)
-        
-        # Model (if present)
-        if spec.model:
-            model_norm = spec.model.lower().replace(" ", "_")
-            parts.append(model_norm)
-        elif spec.product_type:
-            type_norm = spec.product_type.lower().replace(" ", "_")
-            parts.append(type_norm)
-        
-        # Specs (if present) - DOMAIN-AGNOSTIC
-        # Include ALL explicitly mentioned specs, not just category-specific ones
-        # CRITICAL: Use canonical unit formatting (GB not gb, V not v)
-        # CRITICAL: Exclude clothing sizes (not price-relevant)
-        for key, value in spec.specs.items():
-            if value is not None:
-                # P0.1: Filter out clothing sizes (not price-relevant)
-                if ProductIdentity._is_clothing_size(key, value):
-                    # Size is mentioned but NOT included in product_key or websearch
-                    continue
-                
-                # Canonicalize spec value with proper unit casing
-                value_norm = ProductIdentity._canonicalize_spec_value(key, value)
-                specs_norm[key] = value_norm
-                
-                # Add to product_key
-                parts.append(f"{value_norm}")
-        
-        product_key = "_".join(parts) if parts else "unknown_product"
-        
-        # Websearch base (for query generation)
-        websearch_parts = []
-        if spec.brand:
-            websearch_parts.append(spec.brand)
-        if spec.model:
-            websearch_parts.append(spec.model)
-        else:
-            websearch_parts.append(spec.product_type)
-        
-        websearch_base = " ".join(websearch_parts)
+        # Memoised on (brand, model, type, specs): the same product is identified several
+        # times per listing (price grouping, websearch query) and across listings
+        spec_items = tuple((key, type(value), value) for key, value in spec.specs.items())
+        try:
+            fields = _identity_fields(spec.brand, spec.model, spec.product_type, spec_items)
+        except TypeError:
+            # Unhashable spec value (list/dict) - compute without the cache
+            fields = _identity_fields.__wrapped__(spec.brand, spec.model, spec.product_type, spec_items)
+        product_key, brand_normalized, model_normalized, type_normalized, specs_items, websearch_base = fields
         
         return ProductIdentity(
             product_key=product_key,
-            brand_normalized=spec.brand.lower() if spec.brand else None,
-            model_normalized=spec.model.lower() if spec.model else None,
-            type_normalized=spec.product_type.lower(),
-            specs_normalized=specs_norm,
+            brand_normalized=brand_normalized,
+            model_normalized=model_normalized,
+            type_normalized=type_normalized,
+            specs_normalized=dict(specs_items),
             websearch_base=websearch_base
         )
     
@@ -337,32 +302,78 @@ class ProductIdentity:
         for spec_value in self.specs_normalized.values():
             parts.append(spec_value)
         
-        # Join parts
-        canonical = "_".join(parts)
-        
-        # Normalize generations (e.g., "2nd generation" -> "gen_2")
-        canonical = self.normalize_generation(canonical)
-        
-        # Remove color terms (not market-defining)
-        color_terms = ["schwarz", "weiss", "rot", "blau", "grün", "gelb", "grau", 
-                       "black", "white", "red", "blue", "green", "yellow", "gray", "grey",
-                       "silber", "silver", "gold", "rosa", "pink"]
-        for color in color_terms:
-            canonical = re.sub(r'\b' + color + r'\b', '', canonical, flags=re.IGNORECASE)
-        
-        # Remove condition terms (not market-defining)
-        condition_terms = ["neu", "new", "gebraucht", "used", "wie_neu", "ovp"]
-        for cond in condition_terms:
-            canonical = re.sub(r'\b' + cond + r'\b', '', canonical, flags=re.IGNORECASE)
-        
-        # Remove marketing noise
-        noise = ["top", "super", "mega", "original", "!!!"]
-        for n in noise:
-            canonical = canonical.replace(n, '')
-        
-        # Clean up: normalize separators and remove duplicates
-        canonical = canonical.replace(' ', '_').replace('-', '_')
-        while '__' in canonical:
-            canonical = canonical.replace('__', '_')
-        
-        return canonical.strip('_').lower()
+        # Join parts; the rest depends only on the joined string (memoised)
+        return _canonicalize_identity_text("_".join(parts))
+
+
+@lru_cache(maxsize=8192)
+def _canonicalize_identity_text(canonical: str) -> str:
+    """Normalization steps of get_canonical_identity_key() applied to the joined parts."""
+    # Normalize generations (e.g., "2nd generation" -> "gen_2")
+    canonical = ProductIdentity.normalize_generation(canonical)
+    
+    # Remove color and condition terms (not market-defining)
+    canonical = _STRIP_TERMS_RE.sub('', canonical)
+    
+    # Remove marketing noise (sequential: removing one term can expose another)
+    for n in _NOISE_TERMS:
+        canonical = canonical.replace(n, '')
+    
+    # Clean up: normalize separators and remove duplicates
+    canonical = _SEPARATOR_RUN_RE.sub('_', canonical)
+    
+    return sys.intern(canonical.strip('_').lower())
+
+
+@lru_cache(maxsize=4096)
+def _identity_fields(brand: Optional[str], model: Optional[str], product_type: str,
+                     spec_items: Tuple[Tuple[str, type, Any], ...]) -> tuple:
+    """
+    Field values for ProductIdentity.from_product_spec().
+    spec_items are (key, type(value), value) so 128 and 128.0 don't share an entry.
+    specs_normalized is returned as item tuple; callers build a fresh dict from it.
+    """
+    parts = []
+    
+    # Lowercased once; used both in product_key (spaces -> "_") and as the normalized fields
+    brand_lower = sys.intern(brand.lower()) if brand else None
+    model_lower = sys.intern(model.lower()) if model else None
+    type_lower = sys.intern(product_type.lower())
+    
+    # Brand (if present)
+    if brand_lower:
+        parts.append(brand_lower.replace(" ", "_"))
+    
+    # Model (if present)
+    if model_lower:
+        parts.append(model_lower.replace(" ", "_"))
+    elif type_lower:
+        parts.append(type_lower.replace(" ", "_"))
+    
+    # Specs (if present) - DOMAIN-AGNOSTIC
+    # Include ALL explicitly mentioned specs, not just category-specific ones
+    # CRITICAL: Use canonical unit formatting (GB not gb, V not v)
+    # CRITICAL: Exclude clothing sizes (not price-relevant)
+    # P0.1: Clothing sizes are mentioned but NOT included in product_key or websearch
+    specs_norm = tuple(
+        (key, ProductIdentity._canonicalize_spec_value(key, value))
+        for key, _, value in spec_items
+        if value is not None and not ProductIdentity._is_clothing_size(key, value)
+    )
+    parts.extend(value_norm for _, value_norm in specs_norm)
+    
+    # Interned: the same keys recur across listings and are used as dict keys downstream
+    product_key = sys.intern("_".join(parts)) if parts else "unknown_product"
+    
+    # Websearch base (for query generation): brand (if present) + model, else product type
+    websearch_name = model or product_type
+    websearch_base = f"{brand} {websearch_name}" if brand else websearch_name
+    
+    return (
+        product_key,
+        brand_lower,
+        model_lower,
+        type_lower,
+        specs_norm,
+        websearch_base,
+    )
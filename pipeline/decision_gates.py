@@ -30,7 +30,7 @@ def _looks_like_bundle(title: str, description: str = "") -> bool:
     # Check for bundle keywords
     for kw in BUNDLE_KEYWORDS:
         if kw in text:
-            if kw in ["stück", "stk"] and not re.search(r'\d+\s*(stück|stk)\s+\w+', text):
+            if kw in {"stück", "stk"} and not re.search(r'\d+\s*(stück|stk)\s+\w+', text):
                 continue
             return True
     
@@ -28,11 +28,14 @@ def calculate_market_resale_from_listings(
     # Filter listings by identity_key
     matching = [l for l in listings if l.get("_identity_key") == identity_key]
     
-    print(f"         🔍 Filtering {len(listings)} listings for identity_key='{identity_key}'")
-    print(f"         Matching listings: {len(matching)}")
+    # Diagnostics (one line per listing) are collected and printed in one write
+    log_lines = []
+    log_lines.append(f"         🔍 Filtering {len(listings)} listings for identity_key='{identity_key}'")
+    log_lines.append(f"         Matching listings: {len(matching)}")
     
     if not matching:
-        print(f"         ❌ No matching listings found")
+        log_lines.append(f"         ❌ No matching listings found")
+        print("\n".join(log_lines))
         return None
     
     # Collect bid samples with smart filtering
@@ -48,31 +51,34 @@ def calculate_market_resale_from_listings(
         
         if not bid:
             rejected_count += 1
-            print(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason=no_bid")
+            log_lines.append(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason=no_bid")
             continue
         
         # Accept if: Active auction (bids_count > 0) with reasonable price
         if bids_count > 0 and bid >= ACTIVE_AUCTION_MIN_PRICE:
             samples.append(bid)
-            print(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (active auction)")
+            log_lines.append(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (active auction)")
         # Accept if: Starting bid (bids_count = 0) but high enough to be realistic
         elif bids_count == 0 and bid >= unrealistic_floor:
             samples.append(bid)
-            print(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (high starting bid)")
+            log_lines.append(f"         ✅ Sample: bid={bid} CHF, bids_count={bids_count} (high starting bid)")
         else:
             rejected_count += 1
             if bids_count > 0:
                 reason = f"below_active_floor (bid={bid} < {ACTIVE_AUCTION_MIN_PRICE})"
             else:
                 reason = f"below_starting_floor (bid={bid} < {unrealistic_floor})"
-            print(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason={reason}")
+            log_lines.append(f"         ❌ Rejected: bid={bid}, bids_count={bids_count}, reason={reason}")
     
-    print(f"         Valid samples: {len(samples)}, Rejected: {rejected_count}")
+    log_lines.append(f"         Valid samples: {len(samples)}, Rejected: {rejected_count}")
     
     if len(samples) < 2:
-        print(f"         ❌ Insufficient samples ({len(samples)} < 2 required)")
+        log_lines.append(f"         ❌ Insufficient samples ({len(samples)} < 2 required)")
+        print("\n".join(log_lines))
         return None
     
+    print("\n".join(log_lines))
+    
     # Calculate median
     median_price = statistics.median(samples)
     
@@ -105,7 +111,13 @@ def calculate_all_market_resale_prices(
     Example: iPhone 12 mini 128GB + iPhone 12 mini 256GB → same market price pool
     """
     # PHASE 4.2: Group by canonical_identity_key instead of variant_key
-    identity_keys = set(l.get("_identity_key") for l in listings if l.get("_identity_key"))
+    # One pass over listings; each key below reads its bucket instead of rescanning all listings
+    listings_by_identity: Dict[str, List[Dict[str, Any]]] = {}
+    for l in listings:
+        identity_key = l.get("_identity_key")
+        if identity_key:
+            listings_by_identity.setdefault(identity_key, []).append(l)
+    identity_keys = listings_by_identity.keys()
     variant_new_prices = variant_new_prices or {}
     
     # Get reference price from query analysis
@@ -131,7 +143,7 @@ def calculate_all_market_resale_prices(
         print(f"\n   🔑 Processing identity_key: '{identity_key}'")
         
         # Use first variant_key for new price lookup (backwards compatibility)
-        matching_listings = [l for l in listings if l.get("_identity_key") == identity_key]
+        matching_listings = listings_by_identity[identity_key]
         print(f"      Current run listings: {len(matching_listings)}")
         
         first_variant_key = matching_listings[0].get("variant_key") if matching_listings else None
@@ -240,6 +252,9 @@ def calculate_soft_market_price(
     if not search_identity or not all_listings_for_variant:
         return None
     
+    # Diagnostics (one line per listing) are collected and printed in one write
+    log_lines = []
+    
     # DEDUPLICATION: Remove duplicate listings by source_id (same listing from DB + current run)
     seen_source_ids = set()
     unique_listings = []
@@ -252,20 +267,20 @@ def calculate_soft_market_price(
         unique_listings.append(listing)
     
     if len(unique_listings) < len(all_listings_for_variant):
-        print(f"   SOFT MARKET: Deduplicated {len(all_listings_for_variant)} → {len(unique_listings)} unique listings")
+        log_lines.append(f"   SOFT MARKET: Deduplicated {len(all_listings_for_variant)} → {len(unique_listings)} unique listings")
     
     # Filter valid samples with bids
     valid_samples = []
-    print(f"   SOFT MARKET DEBUG: Processing {len(unique_listings)} listings for identity='{search_identity}'")
+    log_lines.append(f"   SOFT MARKET DEBUG: Processing {len(unique_listings)} listings for identity='{search_identity}'")
     for idx, listing in enumerate(unique_listings):
         bid = listing.get("current_bid") or listing.get("current_price_ricardo")
         bids_count = listing.get("bids_count", 0)
         hours_remaining = listing.get("hours_remaining", 999)
         
-        print(f"      [{idx}] bid={bid}, bids_count={bids_count}, hours_remaining={hours_remaining}")
+        log_lines.append(f"      [{idx}] bid={bid}, bids_count={bids_count}, hours_remaining={hours_remaining}")
         
         if not bid or bid <= 0 or bids_count == 0:
-            print(f"      [{idx}] REJECTED: bid={bid}, bids_count={bids_count}")
+            log_lines.append(f"      [{idx}] REJECTED: bid={bid}, bids_count={bids_count}")
             continue
         
         # Time adjustment factor
@@ -280,9 +295,10 @@ def calculate_soft_market_price(
         
         adjusted_bid = bid * time_factor
         valid_samples.append(adjusted_bid)
-        print(f"      [{idx}] ACCEPTED: adjusted_bid={adjusted_bid:.2f}")
+        log_lines.append(f"      [{idx}] ACCEPTED: adjusted_bid={adjusted_bid:.2f}")
     
-    print(f"   SOFT MARKET DEBUG: valid_samples count={len(valid_samples)}")
+    log_lines.append(f"   SOFT MARKET DEBUG: valid_samples count={len(valid_samples)}")
+    print("\n".join(log_lines))
     
     # Require at least 2 samples
     if len(valid_samples) < 2:
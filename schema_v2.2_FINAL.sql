@@ -128,6 +128,7 @@ COMMENT ON COLUMN listings.last_seen IS 'When this listing was last seen in a ru
 COMMENT ON COLUMN listings.seller_rating IS 'Seller trustworthiness percentage (0-100)';
 
 CREATE INDEX idx_listings_run ON listings(run_id);
+CREATE INDEX idx_listings_run_id_id ON listings(run_id, id);
 CREATE INDEX idx_listings_product ON listings(product_id);
 CREATE INDEX idx_listings_end_time ON listings(end_time) WHERE end_time IS NOT NULL;
 CREATE INDEX idx_listings_platform_source ON listings(platform, source_id);
@@ -20,7 +20,7 @@ Features:
 import re
 import statistics
 from datetime import datetime
-from typing import Iterator, Dict, Any, Optional, List
+from typing import Callable, Iterator, Dict, Any, Optional, List
 from playwright.sync_api import BrowserContext, TimeoutError as PWTimeout, Page
 
 PRICE_RE = re.compile(r"\d[\d'' .]*", re.I)
@@ -411,10 +411,14 @@ def search_ricardo(
     ua: Optional[str],
     timeout_sec: int = 18,
     max_pages: int = 2,
+    title_filter: Optional[Callable[[str], bool]] = None,
 ) -> Iterator[Dict[str, Any]]:
     """
     Scrapes Ricardo SERP for a search query.
     
+    If title_filter is given, it is called with each raw title before the
+    card is parsed; cards it rejects (returns False) are skipped entirely.
+    
     Yields listings with:
     - platform, listing_id, title, url
     - image_url
@@ -459,9 +463,11 @@ def search_ricardo(
                     continue
                 seen.add(lid)
 
-                img = r.get("imgUrl") or None
                 title = r.get("title") or ""
+                if title_filter is not None and not title_filter(title):
+                    continue
 
+                img = r.get("imgUrl") or None
                 current_bid = parse_price(r.get("currentBidPrice"))
                 buy_now = parse_price(r.get("buyNowPrice"))
                 
@@ -0,0 +1,72 @@
+"""
+Tests for exact-duplicate handling in batch extraction
+=======================================================
+_dedupe_listings() picks one representative per normalized title + description,
+and _copy_duplicate_results() gives every duplicate its own copy of the
+representative's extraction (or a failed extraction if there is none).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from extraction.ai_extractor_batch import _dedupe_listings, _copy_duplicate_results
+from models.extracted_product import ExtractedProduct
+from models.product_spec import ProductSpec
+
+
+def test_dedupe_normalizes_case_and_whitespace():
+    listings = [
+        {"listing_id": "1", "title": "Garmin Fenix 7", "description": "Top Zustand"},
+        {"listing_id": "2", "title": "garmin  fenix 7 ", "description": "top zustand"},
+        {"listing_id": "3", "title": "Garmin Fenix 6", "description": "Top Zustand"},
+    ]
+    unique, duplicates = _dedupe_listings(listings)
+
+    assert [l["listing_id"] for l in unique] == ["1", "3"]
+    assert [(l["listing_id"], rep_id) for l, rep_id in duplicates] == [("2", "1")]
+
+
+def test_dedupe_representative_without_listing_id():
+    """A None listing_id on the representative must not make its duplicates look new."""
+    listings = [
+        {"listing_id": None, "title": "Hantelscheibe 20kg"},
+        {"listing_id": "2", "title": "Hantelscheibe 20kg"},
+    ]
+    unique, duplicates = _dedupe_listings(listings)
+
+    assert len(unique) == 1
+    assert [(l["listing_id"], rep_id) for l, rep_id in duplicates] == [("2", None)]
+
+
+def test_copy_duplicate_results_deep_copies_representative():
+    rep = ExtractedProduct(
+        listing_id="1",
+        original_title="Garmin Fenix 7",
+        products=[ProductSpec(brand="Garmin", model="Fenix 7", product_type="Smartwatch")],
+        quantities=[1],
+        ai_cost_usd=0.002,
+    )
+    results = {"1": rep}
+    _copy_duplicate_results(results, [({"listing_id": "2", "title": "garmin fenix 7"}, "1")])
+
+    dup = results["2"]
+    assert dup is not rep
+    assert dup.listing_id == "2"
+    assert dup.original_title == "garmin fenix 7"
+    assert dup.ai_cost_usd == 0.0
+    assert dup.products == rep.products
+    assert dup.products[0] is not rep.products[0]
+    # Representative is left untouched
+    assert rep.listing_id == "1" and rep.ai_cost_usd == 0.002
+
+
+def test_copy_duplicate_results_failed_representative():
+    results = {}
+    _copy_duplicate_results(results, [({"listing_id": "2", "title": "Fenix 7"}, "1")])
+
+    dup = results["2"]
+    assert dup.extraction_status == "FAILED"
+    assert dup.listing_id == "2"
+    assert dup.original_title == "Fenix 7"
+    assert dup.products == []
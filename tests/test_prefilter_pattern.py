@@ -0,0 +1,49 @@
+"""
+Tests for the grouped exclude/defect pre-filter pattern
+========================================================
+Verifies compile_grouped_terms_pattern() on the Hyperscan path (when installed)
+and the regex fallback: .search() returns None or a match whose .lastgroup
+names the term list that hit.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+import utils_text
+from utils_text import compile_grouped_terms_pattern, HYPERSCAN_AVAILABLE
+
+
+GROUPS = {"exclude": ["defekt", "ersatzteile"], "defect": ["kaputt", "display gebrochen"]}
+
+
+@pytest.mark.skipif(not HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+def test_hyperscan_exclude_term_does_not_raise():
+    """An exclude hit stops the scan early; search() must return, not raise."""
+    pattern = compile_grouped_terms_pattern(GROUPS)
+    assert isinstance(pattern, utils_text._HyperscanGroupedPattern)
+
+    match = pattern.search("iphone 12 defekt")
+    assert match is not None
+    assert match.lastgroup == "exclude"
+
+
+@pytest.mark.skipif(not HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+def test_hyperscan_exclude_wins_over_defect():
+    pattern = compile_grouped_terms_pattern(GROUPS)
+
+    assert pattern.search("Display gebrochen, Ersatzteile").lastgroup == "exclude"
+    assert pattern.search("iPhone 12 kaputt").lastgroup == "defect"
+    assert pattern.search("iPhone 12 128GB") is None
+
+
+def test_regex_fallback(monkeypatch):
+    monkeypatch.setattr(utils_text, "HYPERSCAN_AVAILABLE", False)
+    pattern = compile_grouped_terms_pattern(GROUPS)
+
+    assert pattern.search("iphone 12 defekt").lastgroup == "exclude"
+    assert pattern.search("iPhone 12 kaputt").lastgroup == "defect"
+    assert pattern.search("iPhone 12 128GB") is None
+    assert compile_grouped_terms_pattern({"exclude": [], "defect": []}) is None
@@ -18,12 +18,22 @@ v7.2 CHANGES:
 import re
 from typing import Optional, Dict, Tuple, List
 
+# Hyperscan for the pre-filter term scan (optional - Linux only, falls back to re)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+_WS_RE = re.compile(r"\s+")
+
 
 def normalize_whitespace(s: str) -> str:
     """Normalizes whitespace in string"""
     if not s:
         return ""
-    return re.sub(r"\s+", " ", s, flags=re.S).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 
 def contains_excluded_terms(text: str, terms: List[str]) -> bool:
@@ -32,6 +42,85 @@ def contains_excluded_terms(text: str, terms: List[str]) -> bool:
     return any(term.lower() in t for term in (terms or []))
 
 
+def compile_terms_pattern(terms: List[str]) -> Optional["re.Pattern"]:
+    """
+    Compiles terms into one case-insensitive substring alternation.
+    pattern.search(text) matches exactly when contains_excluded_terms(text, terms)
+    is True, but scans the text once instead of once per term.
+    Returns None for an empty term list.
+    """
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(term.lower()) for term in terms), re.IGNORECASE)
+
+
+def compile_grouped_terms_pattern(groups: Dict[str, List[str]]) -> Optional["re.Pattern"]:
+    """
+    Compiles several term lists into one case-insensitive alternation with a
+    named group per list, so one scan finds the leftmost term of any list and
+    match.lastgroup tells which list it came from.
+    Empty lists are left out; returns None if all are empty.
+    With Hyperscan installed a _HyperscanGroupedPattern is returned instead
+    (same .search() / .lastgroup use).
+    """
+    if HYPERSCAN_AVAILABLE and any(groups.values()):
+        try:
+            return _HyperscanGroupedPattern(groups)
+        except hyperscan.error:
+            pass  # pattern Hyperscan can't compile - use re below
+    parts = [
+        f"(?P<{name}>" + "|".join(re.escape(term.lower()) for term in terms) + ")"
+        for name, terms in groups.items() if terms
+    ]
+    if not parts:
+        return None
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+class _GroupedMatch:
+    """Minimal stand-in for re.Match: only lastgroup is provided."""
+    __slots__ = ("lastgroup",)
+
+    def __init__(self, lastgroup: str):
+        self.lastgroup = lastgroup
+
+
+class _HyperscanGroupedPattern:
+    """
+    Hyperscan-backed replacement for the compile_grouped_terms_pattern() regex.
+    search() returns an object with .lastgroup, or None. Unlike re, lastgroup is
+    not the leftmost match but the first group (in dict order) with any match,
+    which is what the pre-filter dispatch needs.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self._names = [name for name, terms in groups.items() if terms]
+        expressions, ids = [], []
+        for group_id, name in enumerate(self._names):
+            for term in groups[name]:
+                expressions.append(re.escape(term.lower()).encode("utf-8"))
+                ids.append(group_id)
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        self._db = hyperscan.Database()
+        self._db.compile(expressions=expressions, ids=ids, elements=len(expressions),
+                         flags=[flags] * len(expressions))
+
+    def search(self, text: str) -> Optional[_GroupedMatch]:
+        hits = set()
+
+        def on_match(group_id, start, end, flags, context):
+            hits.add(group_id)
+            return group_id == 0  # first group found: nothing better to wait for
+
+        try:
+            self._db.scan(text.lower().encode("utf-8"), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass  # on_match stopped the scan early; hits is already filled
+        if not hits:
+            return None
+        return _GroupedMatch(self._names[min(hits)])
+
+
 def extract_plz(location_text: str) -> Optional[str]:
     """Extracts Swiss postal code (4 digits) from text"""
     if not location_text: